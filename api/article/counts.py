@@ -0,0 +1,87 @@
+import json
+from datetime import date
+from typing import Literal
+
+from sqlalchemy import select, func, text, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from api.article.filter_query import query_article_count, query_article_ids
+from cache import TTLCache
+from config import settings
+from database.models import ArticleCounter, User
+
+count_cache = TTLCache(
+    maxsize=settings.ARTICLE_COUNT_CACHE_SIZE,
+    ttl=settings.ARTICLE_COUNT_CACHE_TTL_SECONDS,
+)
+
+
+async def _counter_total(
+    session: AsyncSession, filter_username: str | None, author_id: int | None
+) -> int:
+    query = select(func.coalesce(func.sum(ArticleCounter.count), 0))
+    if filter_username is not None:
+        query = query.join(User, User.id == ArticleCounter.user_id).where(
+            User.username == filter_username
+        )
+    if author_id is not None:
+        query = query.where(ArticleCounter.user_id == author_id)
+    return await session.scalar(query)
+
+
+async def _table_estimate(session: AsyncSession) -> int | None:
+    estimate = await session.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'article'::regclass")
+    )
+    if estimate is not None and estimate >= 0:
+        return estimate
+
+
+async def _planner_estimate(
+    session: AsyncSession, query: Select | StatementLambdaElement
+) -> int:
+    # The statement keeps its bind parameters and goes to the driver as is,
+    # so filter values are never rendered into the SQL text.
+    connection = await session.connection()
+    compiled = query.compile(dialect=connection.dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+    )
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_articles(
+    session: AsyncSession,
+    filter_username: str | None,
+    date_from: date | None,
+    date_to: date | None,
+    mode: Literal["exact", "estimated"],
+    author_id: int | None = None,
+) -> int:
+    if date_from is None and date_to is None:
+        if mode == "estimated" and filter_username is None and author_id is None:
+            estimate = await _table_estimate(session)
+            if estimate is not None:
+                return estimate
+        return await _counter_total(session, filter_username, author_id)
+
+    if mode == "estimated":
+        return await _planner_estimate(
+            session, query_article_ids(filter_username, author_id, date_from, date_to)
+        )
+
+    key = (filter_username, author_id, date_from, date_to)
+    total = count_cache.get(key)
+    if total is None:
+        total = await session.scalar(
+            query_article_count(filter_username, author_id, date_from, date_to)
+        )
+        count_cache.set(key, total)
+    return total
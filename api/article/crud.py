@@ -1,82 +1,262 @@
+from collections import Counter
 from datetime import date
+from typing import AsyncIterator
 
-from sqlalchemy import select, update
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Row,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from api.article.filter_query import (
-    query_filter_date_and_username,
-    query_filter_username,
-    query_filter_date,
-    query_without_filters,
+    ArticleOrder,
+    query_articles,
+    query_for_export,
+    query_search,
 )
 from api.article.schemas import ArticleCreate, ArticleUpdate
-from database.db_helper import db_helper
-from database.models import Article
+from database.models import Article, ArticleCounter, ArticleDailyStats, User
+
+
+async def _adjust_article_counters(
+    session: AsyncSession, user_id: int, delta: int
+) -> None:
+    # Only the author's row is touched, so writers by different authors never
+    # wait on each other; the unfiltered total is the sum over all authors.
+    stmt = pg_insert(ArticleCounter).values(user_id=user_id, count=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ArticleCounter.user_id],
+        set_={"count": ArticleCounter.count + stmt.excluded.count},
+    )
+    await session.execute(stmt)
+
+
+async def _adjust_daily_stats(
+    session: AsyncSession, user_id: int, deltas: dict[date, int]
+) -> None:
+    stmt = pg_insert(ArticleDailyStats).values(
+        [
+            {"user_id": user_id, "day": day, "count": delta}
+            for day, delta in sorted(deltas.items())
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ArticleDailyStats.user_id, ArticleDailyStats.day],
+        set_={"count": ArticleDailyStats.count + stmt.excluded.count},
+    )
+    await session.execute(stmt)
+
+
+async def _create_article(
+    session: AsyncSession, article_in: ArticleCreate, user_id: int
+) -> Article:
+    article = Article(user_id=user_id, **article_in.model_dump())
+    session.add(article)
+    await session.flush()
+    await _adjust_article_counters(session, user_id=user_id, delta=1)
+    await _adjust_daily_stats(
+        session, user_id=user_id, deltas={article.created_at.date(): 1}
+    )
+    return article
 
 
-async def _create_article(article_in: ArticleCreate, user_id: int) -> Article:
-    async with db_helper.session_factory() as session:
-        article = Article(user_id=user_id, **article_in.model_dump())
-        session.add(article)
-        await session.commit()
-        return article
+async def _create_articles(
+    session: AsyncSession, articles_in: list[ArticleCreate], user_id: int
+) -> list[Row]:
+    if not articles_in:
+        return []
+
+    stmt = insert(Article).returning(
+        Article.id, Article.created_at, sort_by_parameter_order=True
+    )
+    rows = await session.execute(
+        stmt,
+        [{"user_id": user_id, **article_in.model_dump()} for article_in in articles_in],
+    )
+    rows = list(rows)
+    await _adjust_article_counters(session, user_id=user_id, delta=len(rows))
+    await _adjust_daily_stats(
+        session,
+        user_id=user_id,
+        deltas=Counter(row.created_at.date() for row in rows),
+    )
+    return rows
 
 
 async def _get_articles(
+    session: AsyncSession,
     filter_username: str | None,
-    filter_date: date | None,
+    date_from: date | None,
+    date_to: date | None,
     page: int,
     limit: int,
+    after_id: int | None = None,
+    excerpt_length: int | None = None,
+    author_id: int | None = None,
+    order: ArticleOrder = "asc",
 ) -> list[Article]:
-    async with db_helper.session_factory() as session:
-        if filter_date and filter_username:
-            query = query_filter_date_and_username(
-                filter_username, filter_date, page, limit
-            )
-            articles = await session.scalars(query)
-            return list(articles)
-        if filter_username:
-            query = query_filter_username(filter_username, page, limit)
-            articles = await session.scalars(query)
-            return list(articles)
-        if filter_date:
-            query = query_filter_date(filter_date, page, limit)
-            articles = await session.scalars(query)
-            return list(articles)
-        else:
-            query = query_without_filters(page, limit)
-            articles = await session.scalars(query)
-            return list(articles)
-
-
-async def _get_article_by_id(article_id: int) -> Article | None:
-    async with db_helper.session_factory() as session:
-        query = (
-            select(Article)
-            .options(joinedload(Article.user))
-            .where(Article.id == article_id)
-        )
-        article = await session.scalar(query)
-        return article
+    query = query_articles(
+        filter_username=filter_username,
+        author_id=author_id,
+        date_from=date_from,
+        date_to=date_to,
+        order=order,
+        page=page,
+        limit=limit,
+        after_id=after_id,
+        excerpt_length=excerpt_length,
+    )
+    articles = await session.scalars(query)
+    return list(articles)
+
+
+async def _search_articles(
+    session: AsyncSession,
+    search: str,
+    limit: int,
+    after: tuple[float, int] | None = None,
+) -> list[Row]:
+    query = query_search(search, limit, after)
+    rows = await session.execute(query)
+    return list(rows)
+
+
+async def _stream_articles(
+    session: AsyncSession,
+    filter_username: str | None,
+    date_from: date | None,
+    date_to: date | None,
+    batch_size: int,
+    author_id: int | None = None,
+) -> AsyncIterator[Article]:
+    query = query_for_export(filter_username, author_id, date_from, date_to)
+    articles = await session.stream_scalars(
+        query, execution_options={"yield_per": batch_size}
+    )
+    async for article in articles:
+        yield article
+
+
+async def _get_article_by_id(session: AsyncSession, article_id: int) -> Article | None:
+    query = (
+        select(Article)
+        .options(joinedload(Article.user))
+        .where(Article.id == article_id)
+    )
+    article = await session.scalar(query)
+    return article
+
+
+async def _write_with_lookup(
+    session: AsyncSession, article_id: int, written: CTE
+) -> Row:
+    # Data-modifying CTEs are invisible to the rest of the statement, so
+    # found reports whether the row existed before the write.
+    found = exists().where(Article.id == article_id).label("found")
+    anchor = select(literal(1)).subquery()
+    query = select(found, written).select_from(anchor.outerjoin(written, true()))
+    result = await session.execute(query)
+    return result.one()
 
 
 async def _update_article(
-    article: Article,
+    session: AsyncSession,
+    article_id: int,
     article_update: ArticleUpdate,
-) -> Article:
-    async with db_helper.session_factory() as session:
-        stmt = (
-            update(Article)
-            .where(Article.id == article.id)
-            .values(article_update.model_dump(exclude_none=True))
-            .returning(Article)
+    permission: ColumnElement[bool],
+) -> Row:
+    updated = (
+        update(Article)
+        .where(Article.id == article_id, permission)
+        .values(
+            **article_update.model_dump(exclude_none=True),
+            version=Article.version + 1,
+        )
+        .returning(
+            Article.id,
+            Article.title,
+            Article.content,
+            Article.created_at,
+            Article.user_id,
+            Article.version,
+        )
+        .cte("updated")
+    )
+    return await _write_with_lookup(session, article_id, updated)
+
+
+async def _delete_article(
+    session: AsyncSession, article_id: int, permission: ColumnElement[bool]
+) -> Row:
+    deleted = (
+        delete(Article)
+        .where(Article.id == article_id, permission)
+        .returning(Article.id, Article.user_id, Article.created_at)
+        .cte("deleted")
+    )
+    result = await _write_with_lookup(session, article_id, deleted)
+    if result.id is not None:
+        await _adjust_article_counters(session, user_id=result.user_id, delta=-1)
+        await _adjust_daily_stats(
+            session, user_id=result.user_id, deltas={result.created_at.date(): -1}
+        )
+    return result
+
+
+async def _get_stats_by_author(
+    session: AsyncSession, date_from: date | None, date_to: date | None, limit: int
+) -> list[Row]:
+    total = func.sum(ArticleDailyStats.count).label("count")
+    query = (
+        select(ArticleDailyStats.user_id, User.username, total)
+        .join(User, User.id == ArticleDailyStats.user_id)
+        .where(*_days_between(date_from, date_to))
+        .group_by(ArticleDailyStats.user_id, User.username)
+        .having(total > 0)
+        .order_by(total.desc(), ArticleDailyStats.user_id)
+        .limit(limit)
+    )
+    rows = await session.execute(query)
+    return list(rows)
+
+
+async def _get_stats_by_day(
+    session: AsyncSession,
+    filter_username: str | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> list[Row]:
+    total = func.sum(ArticleDailyStats.count).label("count")
+    query = select(ArticleDailyStats.day, total)
+    if filter_username is not None:
+        query = query.join(User, User.id == ArticleDailyStats.user_id).where(
+            User.username == filter_username
         )
-        article_update = await session.scalar(stmt)
-        await session.commit()
-        return article_update
+    query = (
+        query.where(*_days_between(date_from, date_to))
+        .group_by(ArticleDailyStats.day)
+        .having(total > 0)
+        .order_by(ArticleDailyStats.day)
+    )
+    rows = await session.execute(query)
+    return list(rows)
 
 
-async def _delete_article(article: Article) -> None:
-    async with db_helper.session_factory() as session:
-        await session.delete(article)
-        await session.commit()
+def _days_between(date_from: date | None, date_to: date | None) -> list:
+    conditions = []
+    if date_from is not None:
+        conditions.append(ArticleDailyStats.day >= date_from)
+    if date_to is not None:
+        conditions.append(ArticleDailyStats.day <= date_to)
+    return conditions
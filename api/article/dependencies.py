@@ -1,12 +1,19 @@
+from datetime import date
 from typing import Annotated
 
-from fastapi import Path, HTTPException, status
+from fastapi import Path, HTTPException, status, Query, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.article.crud import _get_article_by_id
+from api.article.pagination import decode_cursor
+from database.db_helper import db_helper
 
 
-async def article_by_id(article_id: Annotated[int, Path]):
-    article = await _get_article_by_id(article_id=article_id)
+async def article_by_id(
+    article_id: Annotated[int, Path],
+    session: AsyncSession = Depends(db_helper.session_dependency),
+):
+    article = await _get_article_by_id(session=session, article_id=article_id)
     if article is not None:
         return article
 
@@ -14,3 +21,68 @@ async def article_by_id(article_id: Annotated[int, Path]):
         status_code=status.HTTP_404_NOT_FOUND,
         detail=f"Article {article_id} is not found!",
     )
+
+
+async def cursor_after_id(
+    cursor: Annotated[
+        str | None, Query(description="Value of X-Next-Cursor from previous page")
+    ] = None,
+) -> int | None:
+    if cursor is None:
+        return None
+
+    values = decode_cursor(cursor)
+    if len(values) != 1 or not isinstance(values[0], int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        )
+    return values[0]
+
+
+async def username_filter(
+    filter_username: Annotated[str | None, Query(alias="username")] = None,
+) -> str | None:
+    # An empty ?username= does not filter, the same as leaving it out.
+    return filter_username or None
+
+
+async def created_date_range(
+    filter_date: Annotated[
+        date | None, Query(alias="date", description="Format 2024-01-21")
+    ] = None,
+    date_from: Annotated[
+        date | None, Query(description="Inclusive, format 2024-01-21")
+    ] = None,
+    date_to: Annotated[
+        date | None, Query(description="Inclusive, format 2024-01-21")
+    ] = None,
+) -> tuple[date | None, date | None]:
+    if filter_date is None:
+        return date_from, date_to
+
+    if date_from is not None or date_to is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either date or date_from/date_to.",
+        )
+    return filter_date, filter_date
+
+
+async def search_cursor_after(
+    cursor: Annotated[
+        str | None, Query(description="Value of X-Next-Cursor from previous page")
+    ] = None,
+) -> tuple[float, int] | None:
+    if cursor is None:
+        return None
+
+    values = decode_cursor(cursor)
+    if (
+        len(values) != 2
+        or not isinstance(values[0], (int, float))
+        or not isinstance(values[1], int)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        )
+    return float(values[0]), values[1]
@@ -0,0 +1,41 @@
+import hashlib
+from typing import Iterable
+
+from fastapi import Request
+
+from config import settings
+from database.models import Article
+
+
+def _strong_etag(value: str) -> str:
+    return f'"{hashlib.sha1(value.encode()).hexdigest()}"'
+
+
+def article_etag(article: Article) -> str:
+    return _strong_etag(f"{article.id}:{article.version}:{article.user.username}")
+
+
+def articles_etag(articles: Iterable[Article], query: str) -> str:
+    parts = [query]
+    parts.extend(
+        f"{article.id}:{article.version}:{article.user.username}"
+        for article in articles
+    )
+    return _strong_etag("|".join(parts))
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.ARTICLE_CACHE_MAX_AGE}, must-revalidate",
+    }
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
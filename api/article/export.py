@@ -0,0 +1,31 @@
+import csv
+import io
+from typing import AsyncIterator
+
+from api.article.schemas import ShowArticle
+from database.models import Article
+
+
+async def ndjson_lines(articles: AsyncIterator[Article]) -> AsyncIterator[str]:
+    async for article in articles:
+        yield ShowArticle.model_validate(article).model_dump_json() + "\n"
+
+
+async def csv_lines(articles: AsyncIterator[Article]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(ShowArticle.model_fields))
+    writer.writeheader()
+    async for article in articles:
+        writer.writerow(ShowArticle.model_validate(article).model_dump(mode="json"))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_lines, "application/x-ndjson"),
+    "csv": (csv_lines, "text/csv"),
+}
@@ -1,60 +1,134 @@
-from datetime import date
+from datetime import date, datetime, time, timedelta
+from typing import Literal
 
-from sqlalchemy import select, cast, Date, Select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, Select, func, tuple_, literal_column, lambda_stmt
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.orm import joinedload, load_only, with_expression
 
 from database.models import Article, User
+from database.models.article import SEARCH_CONFIG
 
 
-def query_filter_date_and_username(
-    filter_username: str | None, filter_date: date | None, page: int, limit: int
-) -> Select:
-    query = (
-        select(Article)
-        .join(User)
-        .options(joinedload(Article.user))
-        .where(
-            cast(Article.created_at, Date) == cast(filter_date, Date),
-            User.username == filter_username,
-        )
-        .order_by(Article.id)
-        .offset((page - 1) * limit)
-        .limit(limit)
-    )
-    return query
+ArticleOrder = Literal["asc", "desc"]
 
 
-def query_filter_username(filter_username: str | None, page: int, limit: int) -> Select:
-    query = (
-        select(Article)
-        .join(User)
-        .options(joinedload(Article.user))
-        .where(User.username == filter_username)
-        .order_by(Article.id)
-        .offset((page - 1) * limit)
-        .limit(limit)
-    )
-    return query
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
 
 
-def query_filter_date(filter_date: date | None, page: int, limit: int) -> Select:
-    query = (
-        select(Article)
-        .options(joinedload(Article.user))
-        .where(cast(Article.created_at, Date) == cast(filter_date, Date))
-        .order_by(Article.id)
-        .offset((page - 1) * limit)
-        .limit(limit)
+# Every filter is appended as its own lambda, so SQLAlchemy caches one
+# statement per filter shape and only re-binds the values on later calls.
+def _filtered(
+    stmt: StatementLambdaElement,
+    filter_username: str | None,
+    author_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> StatementLambdaElement:
+    if filter_username is not None:
+        stmt += lambda s: s.join(User).where(User.username == filter_username)
+    if author_id is not None:
+        stmt += lambda s: s.where(Article.user_id == author_id)
+    if date_from is not None:
+        created_from = _day_start(date_from)
+        stmt += lambda s: s.where(Article.created_at >= created_from)
+    if date_to is not None:
+        created_before = _day_start(date_to + timedelta(days=1))
+        stmt += lambda s: s.where(Article.created_at < created_before)
+    return stmt
+
+
+def summary_options(excerpt_length: int) -> tuple:
+    return (
+        load_only(
+            Article.id,
+            Article.title,
+            Article.created_at,
+            Article.user_id,
+            Article.version,
+        ),
+        with_expression(Article.excerpt, func.left(Article.content, excerpt_length)),
+        joinedload(Article.user).load_only(User.username),
     )
-    return query
 
 
-def query_without_filters(page: int, limit: int) -> Select:
+def query_articles(
+    filter_username: str | None,
+    author_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+    order: ArticleOrder,
+    page: int,
+    limit: int,
+    after_id: int | None = None,
+    excerpt_length: int | None = None,
+) -> StatementLambdaElement:
+    stmt = lambda_stmt(lambda: select(Article).options(joinedload(Article.user)))
+    stmt = _filtered(stmt, filter_username, author_id, date_from, date_to)
+
+    if order == "desc":
+        stmt += lambda s: s.order_by(Article.id.desc())
+        if after_id is not None:
+            stmt += lambda s: s.where(Article.id < after_id)
+    else:
+        stmt += lambda s: s.order_by(Article.id)
+        if after_id is not None:
+            stmt += lambda s: s.where(Article.id > after_id)
+
+    if after_id is None:
+        offset = (page - 1) * limit
+        stmt += lambda s: s.offset(offset)
+    stmt += lambda s: s.limit(limit)
+
+    if excerpt_length is not None:
+        stmt += lambda s: s.options(*summary_options(excerpt_length))
+    return stmt
+
+
+def query_article_ids(
+    filter_username: str | None,
+    author_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> StatementLambdaElement:
+    stmt = lambda_stmt(lambda: select(Article.id))
+    return _filtered(stmt, filter_username, author_id, date_from, date_to)
+
+
+def query_article_count(
+    filter_username: str | None,
+    author_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> StatementLambdaElement:
+    stmt = lambda_stmt(lambda: select(func.count(Article.id)))
+    return _filtered(stmt, filter_username, author_id, date_from, date_to)
+
+
+def query_for_export(
+    filter_username: str | None,
+    author_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> StatementLambdaElement:
+    stmt = lambda_stmt(lambda: select(Article).options(joinedload(Article.user)))
+    stmt = _filtered(stmt, filter_username, author_id, date_from, date_to)
+    stmt += lambda s: s.order_by(Article.id)
+    return stmt
+
+
+def query_search(
+    search: str, limit: int, after: tuple[float, int] | None = None
+) -> Select:
+    ts_query = func.websearch_to_tsquery(
+        literal_column(f"'{SEARCH_CONFIG}'::regconfig"), search
+    )
+    rank = func.ts_rank(Article.search_vector, ts_query)
     query = (
-        select(Article)
+        select(Article, rank.label("rank"))
         .options(joinedload(Article.user))
-        .order_by(Article.id)
-        .offset((page - 1) * limit)
-        .limit(limit)
+        .where(Article.search_vector.bool_op("@@")(ts_query))
     )
-    return query
+    if after is not None:
+        query = query.where(tuple_(rank, Article.id) < tuple_(*after))
+    return query.order_by(rank.desc(), Article.id.desc()).limit(limit)
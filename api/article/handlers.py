@@ -1,113 +1,337 @@
 from datetime import date
-from typing import Annotated
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    Query,
+    HTTPException,
+    Response,
+    Body,
+    Request,
+    Path,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.article.crud import (
     _create_article,
+    _create_articles,
     _get_articles,
+    _stream_articles,
+    _search_articles,
+    _get_stats_by_author,
+    _get_stats_by_day,
     _update_article,
     _delete_article,
 )
-from api.article.dependencies import article_by_id
-from api.article.permissions import check_permissions
+from api.article.counts import count_articles
+from api.article.dependencies import (
+    article_by_id,
+    cursor_after_id,
+    created_date_range,
+    search_cursor_after,
+    username_filter,
+)
+from api.article.etag import (
+    article_etag,
+    articles_etag,
+    cache_headers,
+    is_not_modified,
+)
+from api.article.export import EXPORT_FORMATS
+from api.article.filter_query import ArticleOrder
+from api.article.pagination import encode_cursor
+from api.article.permissions import check_write_result, permission_clause
 from api.article.schemas import (
     ArticleCreate,
+    ArticleAuthorStats,
+    ArticleDayStats,
+    ArticleBulkCreated,
+    ArticleBulkError,
     ArticleUpdate,
     ShowArticle,
+    ShowArticleSummary,
     ShowArticleAfterCreate,
     ShowArticleAfterUpdate,
+    ShowArticleBulkCreate,
 )
+from api.responses import fast_response
 from authentication.auth import get_current_user
+from config import settings
+from database.db_helper import db_helper, ReplicaFallbackRoute
 from database.models import User, Article
 
-router = APIRouter(tags=["Article"], prefix="/article")
+router = APIRouter(
+    tags=["Article"], prefix="/article", route_class=ReplicaFallbackRoute
+)
 
 
 @router.post(
     "/", response_model=ShowArticleAfterCreate, status_code=status.HTTP_201_CREATED
 )
 async def create_article(
-    article_in: ArticleCreate, user: User = Depends(get_current_user)
+    article_in: ArticleCreate,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ) -> ShowArticleAfterCreate:
-    new_article = await _create_article(article_in=article_in, user_id=user.id)
-    return ShowArticleAfterCreate(
-        title=new_article.title,
-        content=new_article.content,
-        id=new_article.id,
-        created_at=new_article.created_at,
-        user_id=new_article.user_id,
+    new_article = await _create_article(
+        session=session, article_in=article_in, user_id=user.id
+    )
+    return ShowArticleAfterCreate.model_validate(new_article)
+
+
+@router.post(
+    "/bulk", response_model=ShowArticleBulkCreate, status_code=status.HTTP_201_CREATED
+)
+async def create_articles_bulk(
+    articles_in: Annotated[list[Any], Body()],
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> ShowArticleBulkCreate:
+    if len(articles_in) > settings.ARTICLE_BULK_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.ARTICLE_BULK_MAX_SIZE} articles per request.",
+        )
+
+    valid_indexes, valid_articles, errors = [], [], []
+    for index, item in enumerate(articles_in):
+        try:
+            valid_articles.append(ArticleCreate.model_validate(item))
+            valid_indexes.append(index)
+        except ValidationError as error:
+            errors.append(
+                ArticleBulkError(
+                    index=index,
+                    errors=error.errors(include_url=False, include_context=False),
+                )
+            )
+    if not valid_articles:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[error.model_dump() for error in errors],
+        )
+
+    rows = await _create_articles(
+        session=session, articles_in=valid_articles, user_id=user.id
+    )
+    return ShowArticleBulkCreate(
+        created=[
+            ArticleBulkCreated(index=index, id=row.id, created_at=row.created_at)
+            for index, row in zip(valid_indexes, rows)
+        ],
+        errors=errors,
     )
 
 
-@router.get("/", response_model=list[ShowArticle], status_code=status.HTTP_200_OK)
+@router.get(
+    "/",
+    response_model=list[ShowArticle] | list[ShowArticleSummary],
+    status_code=status.HTTP_200_OK,
+)
 async def get_articles(
+    request: Request,
+    response: Response,
     page: int = 1,
     limit: int = 5,
-    filter_username: Annotated[str | None, Query(alias="username")] = None,
-    filter_date: Annotated[
-        date | None, Query(alias="date", description="Format 2024-01-21")
+    fields: Annotated[
+        Literal["full", "summary"],
+        Query(description="summary returns an excerpt instead of content"),
+    ] = "full",
+    total: Annotated[
+        Literal["exact", "estimated"] | None,
+        Query(description="Return the number of matching articles in X-Total-Count"),
     ] = None,
-) -> list[ShowArticle]:
+    order: Annotated[
+        ArticleOrder, Query(description="asc returns oldest first, desc newest first")
+    ] = "asc",
+    filter_username: str | None = Depends(username_filter),
+    author_id: int | None = None,
+    date_range: tuple[date | None, date | None] = Depends(created_date_range),
+    after_id: int | None = Depends(cursor_after_id),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> list[ShowArticle] | list[ShowArticleSummary]:
+    date_from, date_to = date_range
     articles = await _get_articles(
-        page=page, limit=limit, filter_username=filter_username, filter_date=filter_date
+        session=session,
+        page=page,
+        limit=limit,
+        filter_username=filter_username,
+        author_id=author_id,
+        date_from=date_from,
+        date_to=date_to,
+        after_id=after_id,
+        excerpt_length=settings.ARTICLE_EXCERPT_LENGTH if fields == "summary" else None,
+        order=order,
     )
-    return [
-        ShowArticle(
-            id=article.id,
-            title=article.title,
-            content=article.content,
-            created_at=article.created_at,
-            user_id=article.user_id,
-            username=article.user.username,
+    headers = cache_headers(articles_etag(articles, request.url.query))
+    if articles and len(articles) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(articles[-1].id)
+    if total is not None:
+        headers["X-Total-Count"] = str(
+            await count_articles(
+                session=session,
+                filter_username=filter_username,
+                date_from=date_from,
+                date_to=date_to,
+                mode=total,
+                author_id=author_id,
+            )
         )
-        for article in articles
-    ]
+    if is_not_modified(request, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    if fields == "summary":
+        summaries = [ShowArticleSummary.model_validate(article) for article in articles]
+        return fast_response(list[ShowArticleSummary], summaries, response)
+    return fast_response(
+        list[ShowArticle],
+        [ShowArticle.model_validate(article) for article in articles],
+        response,
+    )
+
+
+@router.get("/search", response_model=list[ShowArticle], status_code=status.HTTP_200_OK)
+async def search_articles(
+    response: Response,
+    search: Annotated[str, Query(alias="q", min_length=1)],
+    limit: int = 5,
+    after: tuple[float, int] | None = Depends(search_cursor_after),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> list[ShowArticle]:
+    rows = await _search_articles(
+        session=session, search=search, limit=limit, after=after
+    )
+    if rows and len(rows) == limit:
+        last_article, last_rank = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last_rank, last_article.id)
+    return fast_response(
+        list[ShowArticle],
+        [ShowArticle.model_validate(article) for article, _ in rows],
+        response,
+    )
 
 
 @router.get(
-    "/{article_id}/", response_model=ShowArticle, status_code=status.HTTP_200_OK
+    "/stats/by-author",
+    response_model=list[ArticleAuthorStats],
+    status_code=status.HTTP_200_OK,
+)
+async def get_stats_by_author(
+    limit: int = 100,
+    date_range: tuple[date | None, date | None] = Depends(created_date_range),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> list[ArticleAuthorStats]:
+    date_from, date_to = date_range
+    rows = await _get_stats_by_author(
+        session=session, date_from=date_from, date_to=date_to, limit=limit
+    )
+    return [ArticleAuthorStats.model_validate(row._asdict()) for row in rows]
+
+
+@router.get(
+    "/stats/by-day",
+    response_model=list[ArticleDayStats],
+    status_code=status.HTTP_200_OK,
 )
-async def get_article_by_id(article: Article = Depends(article_by_id)) -> ShowArticle:
-    return ShowArticle(
-        id=article.id,
-        title=article.title,
-        content=article.content,
-        created_at=article.created_at,
-        user_id=article.user_id,
-        username=article.user.username,
+async def get_stats_by_day(
+    filter_username: str | None = Depends(username_filter),
+    date_range: tuple[date | None, date | None] = Depends(created_date_range),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> list[ArticleDayStats]:
+    date_from, date_to = date_range
+    rows = await _get_stats_by_day(
+        session=session,
+        filter_username=filter_username,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return [ArticleDayStats.model_validate(row._asdict()) for row in rows]
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_articles(
+    request: Request,
+    response: Response,
+    export_format: Annotated[
+        Literal["ndjson", "csv"], Query(alias="format")
+    ] = "ndjson",
+    filter_username: str | None = Depends(username_filter),
+    date_range: tuple[date | None, date | None] = Depends(created_date_range),
+) -> StreamingResponse:
+    date_from, date_to = date_range
+    engine = db_helper.engine_for_request(request, response)
+    format_lines, media_type = EXPORT_FORMATS[export_format]
+
+    async def lines():
+        async with db_helper.session_factory(bind=engine) as session:
+            async with session.begin():
+                articles = _stream_articles(
+                    session=session,
+                    filter_username=filter_username,
+                    date_from=date_from,
+                    date_to=date_to,
+                    batch_size=settings.ARTICLE_EXPORT_BATCH_SIZE,
+                )
+                async for line in format_lines(articles):
+                    yield line
+
+    return StreamingResponse(
+        lines(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="articles.{export_format}"'
+        },
     )
 
 
+@router.get(
+    "/{article_id}/", response_model=ShowArticle, status_code=status.HTTP_200_OK
+)
+async def get_article_by_id(
+    request: Request, response: Response, article: Article = Depends(article_by_id)
+) -> ShowArticle:
+    headers = cache_headers(article_etag(article))
+    if is_not_modified(request, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return fast_response(ShowArticle, ShowArticle.model_validate(article), response)
+
+
 @router.put(
     "/{article_id}/",
     response_model=ShowArticleAfterUpdate,
     status_code=status.HTTP_200_OK,
 )
 async def update_article(
+    article_id: Annotated[int, Path],
     article_update: ArticleUpdate,
-    article: Article = Depends(article_by_id),
     current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ) -> ShowArticleAfterUpdate:
-    check_permissions(article=article, current_user=current_user)
-    article_update = await _update_article(
-        article=article, article_update=article_update
-    )
-
-    return ShowArticleAfterUpdate(
-        id=article_update.id,
-        title=article_update.title,
-        content=article_update.content,
-        created_at=article_update.created_at,
-        user_id=article_update.user_id,
+    result = await _update_article(
+        session=session,
+        article_id=article_id,
+        article_update=article_update,
+        permission=permission_clause(current_user),
     )
+    check_write_result(result, article_id)
+    return ShowArticleAfterUpdate.model_validate(result)
 
 
 @router.delete("/{article_id}/", status_code=status.HTTP_200_OK)
 async def delete_article(
-    article: Article = Depends(article_by_id),
+    article_id: Annotated[int, Path],
     current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ) -> dict:
-    check_permissions(article=article, current_user=current_user)
-    await _delete_article(article)
-    return {"details": f"Article with id:{article.id} deleted successfully"}
+    result = await _delete_article(
+        session, article_id=article_id, permission=permission_clause(current_user)
+    )
+    check_write_result(result, article_id)
+    return {"details": f"Article with id:{article_id} deleted successfully"}
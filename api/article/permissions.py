@@ -1,12 +1,22 @@
 from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, Row, true
 
+from authentication.principal import Principal
 from database.models import Article, User
 
 
-def check_permissions(article: Article, current_user: User) -> bool:
-    if article.user_id != current_user.id:
-        if current_user.is_admin or current_user.is_superadmin:
-            return True
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+def permission_clause(current_user: User | Principal) -> ColumnElement[bool]:
+    if current_user.is_admin or current_user.is_superadmin:
+        return true()
+    return Article.user_id == current_user.id
 
-    return True
+
+def check_write_result(result: Row, article_id: int) -> None:
+    if result.id is not None:
+        return
+    if not result.found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Article {article_id} is not found!",
+        )
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
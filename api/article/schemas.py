@@ -1,6 +1,8 @@
-from datetime import datetime
+from datetime import datetime, date
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, AliasChoices, AliasPath
+
+from database.models.article import TITLE_MAX_LENGTH
 
 
 class ArticleBase(BaseModel):
@@ -9,24 +11,72 @@ class ArticleBase(BaseModel):
 
 
 class ArticleCreate(ArticleBase):
-    pass
+    title: str = Field(max_length=TITLE_MAX_LENGTH)
 
 
 class ShowArticleAfterCreate(ArticleBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
     user_id: int
 
 
 class ArticleUpdate(ArticleBase):
-    title: str | None = None
+    title: str | None = Field(None, max_length=TITLE_MAX_LENGTH)
     content: str | None = None
 
 
 class ShowArticleAfterUpdate(ArticleBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    created_at: datetime
+    user_id: int
+
+
+class ArticleBulkCreated(BaseModel):
+    index: int
+    id: int
+    created_at: datetime
+
+
+class ArticleBulkError(BaseModel):
+    index: int
+    errors: list[dict]
+
+
+class ShowArticleBulkCreate(BaseModel):
+    created: list[ArticleBulkCreated]
+    errors: list[ArticleBulkError]
+
+
+class ArticleAuthorStats(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    user_id: int
+    username: str
+    count: int
+
+
+class ArticleDayStats(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    day: date
+    count: int
+
+
+class ShowArticleSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
+    title: str
+    excerpt: str
     created_at: datetime
     user_id: int
+    username: str = Field(
+        validation_alias=AliasChoices("username", AliasPath("user", "username"))
+    )
 
 
 class ShowArticle(ArticleBase):
@@ -35,4 +85,6 @@ class ShowArticle(ArticleBase):
     id: int
     created_at: datetime
     user_id: int
-    username: str
+    username: str = Field(
+        validation_alias=AliasChoices("username", AliasPath("user", "username"))
+    )
@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from config import settings
+
+RESPONSE_CLASSES = {"json": JSONResponse, "orjson": ORJSONResponse}
+
+default_response_class = RESPONSE_CLASSES[settings.RESPONSE_CLASS]
+
+
+@lru_cache
+def _type_adapter(model_type: Any) -> TypeAdapter:
+    return TypeAdapter(model_type)
+
+
+def fast_response(model_type: Any, content: Any, response: Response) -> Any:
+    if default_response_class is JSONResponse:
+        return content
+
+    rendered = default_response_class(
+        content=_type_adapter(model_type).dump_python(content),
+        status_code=response.status_code or 200,
+    )
+    rendered.raw_headers.extend(response.headers.raw)
+    return rendered
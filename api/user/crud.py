@@ -1,53 +1,74 @@
-from sqlalchemy import update, select
+from sqlalchemy import update, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.user.schemas import UserCreate, UserUpdate, RolesUpdate
-from database.db_helper import db_helper
+from api.user.schemas import UserCreate, UserUpdate
+from authentication.user_cache import invalidate_cached_users_on_commit
 from database.models import User
+from database.models.user import Role
 
 
-async def _create_user(user_in: UserCreate, hashed_password: str) -> User:
-    async with db_helper.session_factory() as session:
-        new_user = User(
-            username=user_in.username,
-            email=user_in.email,
-            hashed_password=hashed_password,
-        )
-        session.add(new_user)
-        await session.commit()
-        return new_user
-
-
-async def _get_user_by_id(user_id: int) -> User:
-    async with db_helper.session_factory() as session:
-        query = select(User).where(User.id == user_id, User.is_active == True)
-        user = await session.scalar(query)
-        if user is not None:
-            return user
-
-
-async def _update_user(data: UserUpdate | RolesUpdate, user: User) -> User:
-    async with db_helper.session_factory() as session:
-        stmt = (
-            update(User)
-            .where(User.id == user.id)
-            .values(**data.model_dump(exclude_none=True))
-            .returning(User)
-        )
-        user_update = await session.scalar(stmt)
-        await session.commit()
-        if user_update is not None:
-            return user_update
-
-
-async def _delete_user(user_id: int) -> int | None:
-    async with db_helper.session_factory() as session:
-        stmt = (
-            update(User)
-            .where(User.id == user_id, User.is_active == True)
-            .values(is_active=False)
-            .returning(User.id)
-        )
-        deleted_user_id = await session.scalar(stmt)
-        await session.commit()
-        if deleted_user_id is not None:
-            return deleted_user_id
+async def _create_user(
+    session: AsyncSession, user_in: UserCreate, hashed_password: str
+) -> User:
+    new_user = User(
+        username=user_in.username,
+        email=user_in.email,
+        hashed_password=hashed_password,
+    )
+    session.add(new_user)
+    await session.flush()
+    return new_user
+
+
+async def _get_user_by_id(session: AsyncSession, user_id: int) -> User:
+    query = select(User).where(User.id == user_id, User.is_active == True)
+    user = await session.scalar(query)
+    if user is not None:
+        return user
+
+
+async def _update_user(session: AsyncSession, data: UserUpdate, user: User) -> User:
+    stmt = (
+        update(User)
+        .where(User.id == user.id)
+        .values(**data.model_dump(exclude_none=True))
+        .returning(User)
+    )
+    user_update = await session.scalar(stmt)
+    invalidate_cached_users_on_commit(session, {user.id})
+    if user_update is not None:
+        return user_update
+
+
+async def _change_admin_privilege(
+    session: AsyncSession, user_ids: list[int], grant: bool
+) -> list[User]:
+    if grant:
+        guard = ~User.role.overlap([Role.ADMIN.value, Role.SUPERADMIN.value])
+        role = func.array_append(User.role, Role.ADMIN.value)
+    else:
+        guard = User.role.contains([Role.ADMIN.value])
+        role = func.array_remove(User.role, Role.ADMIN.value)
+
+    stmt = (
+        update(User)
+        .where(User.id.in_(user_ids), User.is_active.is_(True), guard)
+        .values(role=role)
+        .returning(User)
+    )
+    users = list(await session.scalars(stmt))
+    invalidate_cached_users_on_commit(session, {user.id for user in users})
+    return users
+
+
+async def _delete_user(session: AsyncSession, user_id: int) -> int | None:
+    stmt = (
+        update(User)
+        .where(User.id == user_id, User.is_active == True)
+        .values(is_active=False)
+        .returning(User.id)
+    )
+    deleted_user_id = await session.scalar(stmt)
+    invalidate_cached_users_on_commit(session, {user_id})
+    if deleted_user_id is not None:
+        return deleted_user_id
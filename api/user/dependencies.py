@@ -1,13 +1,18 @@
 from typing import Annotated
 
-from fastapi import HTTPException, status, Path
+from fastapi import HTTPException, status, Path, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.user.crud import _get_user_by_id
+from database.db_helper import db_helper
 from database.models import User
 
 
-async def user_by_id(user_id: Annotated[int, Path]) -> User:
-    user = await _get_user_by_id(user_id)
+async def user_by_id(
+    user_id: Annotated[int, Path],
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> User:
+    user = await _get_user_by_id(session, user_id)
     if user is not None:
         return user
 
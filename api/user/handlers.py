@@ -1,150 +1,141 @@
 from typing import Annotated
 
-from fastapi import APIRouter, status, HTTPException, Depends, Path
-
-from api.user.crud import _create_user, _delete_user, _update_user, _get_user_by_id
+from fastapi import APIRouter, status, HTTPException, Depends, Path, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.user.crud import (
+    _create_user,
+    _delete_user,
+    _update_user,
+    _get_user_by_id,
+    _change_admin_privilege,
+)
 from api.user.dependencies import user_by_id
-from api.user.permissions import check_user_permissions_for_delete
-from api.user.schemas import UserCreate, ShowUser, UserDelete, UserUpdate, RolesUpdate
+from api.user.permissions import (
+    check_user_permissions_for_delete,
+    check_privilege_manager,
+)
+from api.user.schemas import (
+    UserCreate,
+    ShowUser,
+    UserDelete,
+    UserUpdate,
+    AdminPrivilegeBatch,
+    AdminPrivilegeBatchResult,
+)
+from api.responses import fast_response
 from authentication.auth import get_current_user
-from authentication.security import get_password_hash
+from authentication.security import password_hasher
+from database.db_helper import db_helper, ReplicaFallbackRoute
 from database.models import User
 
-router = APIRouter(tags=["User"], prefix="/user")
+router = APIRouter(tags=["User"], prefix="/user", route_class=ReplicaFallbackRoute)
 
 
 @router.post("/", response_model=ShowUser, status_code=status.HTTP_201_CREATED)
-async def create_user(user_in: UserCreate) -> ShowUser:
-    hashed_password = get_password_hash(user_in.password)
-    user = await _create_user(user_in=user_in, hashed_password=hashed_password)
-    return ShowUser(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        role=user.role,
-        is_active=user.is_active,
+async def create_user(
+    user_in: UserCreate, session: AsyncSession = Depends(db_helper.session_dependency)
+) -> ShowUser:
+    hashed_password = await password_hasher.hash(user_in.password)
+    user = await _create_user(
+        session=session, user_in=user_in, hashed_password=hashed_password
     )
+    return ShowUser.model_validate(user)
 
 
 @router.get("/{user_id}/", response_model=ShowUser, status_code=status.HTTP_200_OK)
-async def get_user_by_id(user: User = Depends(user_by_id)) -> ShowUser:
-    return ShowUser(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        role=user.role,
-        is_active=user.is_active,
-    )
+async def get_user_by_id(
+    response: Response, user: User = Depends(user_by_id)
+) -> ShowUser:
+    return fast_response(ShowUser, ShowUser.model_validate(user), response)
 
 
 @router.put("/", response_model=ShowUser, status_code=status.HTTP_200_OK)
 async def update_user(
-    user_in: UserUpdate, user: User = Depends(get_current_user)
+    user_in: UserUpdate,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ) -> ShowUser:
-    user_update = await _update_user(data=user_in, user=user)
-    return ShowUser(
-        id=user_update.id,
-        username=user_update.username,
-        email=user_update.email,
-        role=user_update.role,
-        is_active=user_update.is_active,
-    )
+    user_update = await _update_user(session=session, data=user_in, user=user)
+    return ShowUser.model_validate(user_update)
 
 
 @router.delete("/{user_id}", response_model=UserDelete, status_code=status.HTTP_200_OK)
 async def delete_user(
-    target_user_id: Annotated[int, Path], current_user: User = Depends(get_current_user)
+    target_user_id: Annotated[int, Path],
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ) -> UserDelete:
     if not await check_user_permissions_for_delete(
-        target_user_id=target_user_id, current_user=current_user
+        session=session, target_user_id=target_user_id, current_user=current_user
     ):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
-    deleted_user_id = await _delete_user(target_user_id)
+    deleted_user_id = await _delete_user(session, target_user_id)
     return UserDelete(deleted_user_id=deleted_user_id)
 
 
-@router.put(
-    "/admin_privilege/", response_model=ShowUser, status_code=status.HTTP_200_OK
-)
-async def grant_admin_privilege(
-    target_user_id: int, current_user: User = Depends(get_current_user)
-):
-    if not current_user.is_superadmin:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden.")
-
-    if current_user.id == target_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot manage privileges of itself.",
-        )
-
-    user_for_promotion = await _get_user_by_id(user_id=target_user_id)
-
-    if user_for_promotion.is_admin or user_for_promotion.is_superadmin:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"User with id {target_user_id} already promoted to admin / superadmin.",
-        )
+async def _change_single_admin_privilege(
+    session: AsyncSession, target_user_id: int, grant: bool
+) -> ShowUser:
+    users = await _change_admin_privilege(session, [target_user_id], grant=grant)
+    if users:
+        return ShowUser.model_validate(users[0])
 
-    if user_for_promotion is None:
+    if await _get_user_by_id(session, user_id=target_user_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {target_user_id} not found.",
         )
+    if grant:
+        detail = (
+            f"User with id {target_user_id} already promoted to admin / superadmin."
+        )
+    else:
+        detail = f"User with id {target_user_id} has no admin privileges."
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
-    new_roles = user_for_promotion.enrich_admin_roles_by_admin_role()
-    user_in = RolesUpdate(role=new_roles)
-    updated_user = await _update_user(data=user_in, user=user_for_promotion)
 
-    return ShowUser(
-        id=updated_user.id,
-        username=updated_user.username,
-        email=updated_user.email,
-        role=updated_user.role,
-        is_active=updated_user.is_active,
-    )
+@router.put(
+    "/admin_privilege/", response_model=ShowUser, status_code=status.HTTP_200_OK
+)
+async def grant_admin_privilege(
+    target_user_id: int,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+):
+    check_privilege_manager(current_user, [target_user_id])
+    return await _change_single_admin_privilege(session, target_user_id, grant=True)
 
 
 @router.delete(
     "/admin_privilege/", response_model=ShowUser, status_code=status.HTTP_200_OK
 )
 async def remove_admin_privilege(
-    target_user_id: int, current_user: User = Depends(get_current_user)
+    target_user_id: int,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    if not current_user.is_superadmin:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden.")
-
-    if current_user.id == target_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot manage privileges of itself.",
-        )
+    check_privilege_manager(current_user, [target_user_id])
+    return await _change_single_admin_privilege(session, target_user_id, grant=False)
 
-    user_for_revoke_admin_privileges = await _get_user_by_id(user_id=target_user_id)
 
-    if not user_for_revoke_admin_privileges.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"User with id {target_user_id} has no admin privileges.",
-        )
-
-    if user_for_revoke_admin_privileges is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User with id {target_user_id} not found.",
-        )
-
-    new_roles = user_for_revoke_admin_privileges.remove_admin_privileges_from_model()
-    user_in = RolesUpdate(role=new_roles)
-    updated_user = await _update_user(
-        data=user_in, user=user_for_revoke_admin_privileges
+@router.post(
+    "/admin_privilege/batch",
+    response_model=AdminPrivilegeBatchResult,
+    status_code=status.HTTP_200_OK,
+)
+async def change_admin_privilege_batch(
+    batch: AdminPrivilegeBatch,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> AdminPrivilegeBatchResult:
+    check_privilege_manager(current_user, batch.user_ids)
+    users = await _change_admin_privilege(
+        session, batch.user_ids, grant=batch.action == "grant"
     )
-
-    return ShowUser(
-        id=updated_user.id,
-        username=updated_user.username,
-        email=updated_user.email,
-        role=updated_user.role,
-        is_active=updated_user.is_active,
+    changed = {user.id for user in users}
+    return AdminPrivilegeBatchResult(
+        changed=sorted(changed),
+        unchanged=sorted(set(batch.user_ids) - changed),
     )
@@ -1,11 +1,13 @@
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.user.crud import _get_user_by_id
+from authentication.principal import Principal
 from database.models import User
 
 
 async def check_user_permissions_for_delete(
-    target_user_id: int, current_user: User
+    session: AsyncSession, target_user_id: int, current_user: User
 ) -> bool:
     if current_user.id == target_user_id and current_user.is_superadmin:
         raise HTTPException(
@@ -18,7 +20,7 @@ async def check_user_permissions_for_delete(
 
     if current_user.id != target_user_id:
         if current_user.is_admin or current_user.is_superadmin:
-            user_for_deletion = await _get_user_by_id(user_id=target_user_id)
+            user_for_deletion = await _get_user_by_id(session, user_id=target_user_id)
             if user_for_deletion is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -35,3 +37,16 @@ async def check_user_permissions_for_delete(
             return True
 
         return False
+
+
+def check_privilege_manager(
+    current_user: User | Principal, target_user_ids: list[int]
+) -> None:
+    if not current_user.is_superadmin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden.")
+
+    if current_user.id in target_user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot manage privileges of itself.",
+        )
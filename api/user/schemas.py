@@ -1,7 +1,11 @@
-from pydantic import BaseModel, EmailStr
+from typing import Literal
+
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 
 
 class ShowUser(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     username: str
     email: EmailStr
@@ -20,8 +24,14 @@ class UserUpdate(BaseModel):
     email: EmailStr | None = None
 
 
-class RolesUpdate(BaseModel):
-    role: list
+class AdminPrivilegeBatch(BaseModel):
+    user_ids: list[int] = Field(min_length=1, max_length=1000)
+    action: Literal["grant", "revoke"]
+
+
+class AdminPrivilegeBatchResult(BaseModel):
+    changed: list[int]
+    unchanged: list[int]
 
 
 class UserDelete(BaseModel):
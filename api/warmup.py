@@ -0,0 +1,71 @@
+import asyncio
+import itertools
+from contextlib import AsyncExitStack
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from api.article.crud import _get_articles, _get_article_by_id
+from authentication.auth import _get_user_by_email
+from authentication.revocation import revocation_list
+from config import settings
+from database.db_helper import DatabaseHelper
+
+# Values no real row has, so warm-up queries exercise the plans but return nothing.
+MISSING_ID = 2**31 - 1
+MISSING_USERNAME = "__warm_up__"
+
+
+async def _run_hot_queries(connection: AsyncConnection) -> None:
+    async with AsyncSession(bind=connection) as session:
+        today = date.today()
+        for (
+            filter_username,
+            author_id,
+            date_from,
+            date_to,
+            after_id,
+            excerpt_length,
+            order,
+        ) in itertools.product(
+            (None, MISSING_USERNAME),
+            (None, MISSING_ID),
+            (None, today),
+            (None, today),
+            (None, MISSING_ID),
+            (None, settings.ARTICLE_EXCERPT_LENGTH),
+            ("asc", "desc"),
+        ):
+            await _get_articles(
+                session=session,
+                filter_username=filter_username,
+                author_id=author_id,
+                date_from=date_from,
+                date_to=date_to,
+                page=1,
+                limit=1,
+                after_id=after_id,
+                excerpt_length=excerpt_length,
+                order=order,
+            )
+        await _get_article_by_id(session, article_id=MISSING_ID)
+        await _get_user_by_email(session, email="")
+
+
+async def _warm_up_engine(engine: AsyncEngine, connections: int) -> None:
+    # Hold every connection open at once so the pool creates distinct ones.
+    async with AsyncExitStack() as stack:
+        opened = [
+            await stack.enter_async_context(engine.connect())
+            for _ in range(connections)
+        ]
+        await asyncio.gather(*(_run_hot_queries(connection) for connection in opened))
+
+
+async def warm_up(db_helper: DatabaseHelper, connections: int) -> None:
+    connections = min(connections, db_helper.pool_size)
+    for engine in db_helper.engines.values():
+        await _warm_up_engine(engine, connections)
+
+    async with db_helper.session_factory() as session:
+        await revocation_list.refresh(session)
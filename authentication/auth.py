@@ -6,8 +6,12 @@ from fastapi.security import OAuth2
 from fastapi.security.utils import get_authorization_scheme_param
 from jose import JWTError, jwt
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from authentication.security import verify_password
+from authentication.principal import Principal
+from authentication.revocation import revocation_list
+from authentication.security import password_hasher
+from authentication.user_cache import get_cached_user, cache_user
 from config import settings
 from database.db_helper import db_helper
 from database.models import User
@@ -45,52 +49,112 @@ class OAuth2PasswordBearerWithCookie(OAuth2):
 oauth2_scheme = OAuth2PasswordBearerWithCookie(tokenUrl="/login/login")
 
 
-async def _get_user_by_email(email: str) -> User:
-    async with db_helper.session_factory() as session:
-        query = select(User).where(User.email == email)
-        user = await session.scalar(query)
-        if user is not None:
-            return user
+async def _get_user_by_email(session: AsyncSession, email: str) -> User:
+    query = select(User).where(User.email == email)
+    user = await session.scalar(query)
+    if user is not None:
+        return user
 
 
 async def authenticate_user(email: str, password: str):
-    user = await _get_user_by_email(email=email)
+    # A short session of its own returns the connection to the pool before
+    # bcrypt runs, instead of holding it for the whole request.
+    async with db_helper.session_factory() as session:
+        user = await _get_user_by_email(session, email=email)
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    if not await password_hasher.verify(password, user.hashed_password):
         return False
     return user
 
 
-async def check_token(token: str) -> User:
-    credentials_exception = HTTPException(
+def access_token_data(user: User) -> dict:
+    data = {"sub": user.email}
+    if settings.AUTH_CLAIMS_MODE:
+        data.update(uid=user.id, roles=list(user.role), active=user.is_active)
+    return data
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM],
         )
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-    user = await _get_user_by_email(email=email)
+        raise _credentials_exception()
+    if payload.get("sub") is None or revocation_list.is_revoked(payload.get("jti")):
+        raise _credentials_exception()
+    return payload
+
+
+def _principal_from_claims(payload: dict) -> Principal | None:
+    try:
+        return Principal(
+            id=payload["uid"],
+            email=payload["sub"],
+            role=payload["roles"],
+            is_active=payload["active"],
+        )
+    except KeyError:
+        return None
+
+
+async def revoke_tokens(session: AsyncSession, tokens: list[str | None]) -> None:
+    payloads = []
+    for token in tokens:
+        if not token:
+            continue
+        try:
+            payloads.append(
+                jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            )
+        except JWTError:
+            continue
+    await revocation_list.revoke(session, payloads)
+
+
+async def check_token(session: AsyncSession, token: str) -> User:
+    await revocation_list.refresh(session)
+    email = _decode_token(token)["sub"]
+    user = get_cached_user(email=email)
     if user is None:
-        raise credentials_exception
+        user = await _get_user_by_email(session, email=email)
+        if user is None:
+            raise _credentials_exception()
+        cache_user(user)
+    if not user.is_active:
+        raise _credentials_exception()
     return user
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
-    user = await check_token(token=token)
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+) -> User | Principal:
+    if settings.AUTH_CLAIMS_MODE:
+        await revocation_list.refresh(session)
+        principal = _principal_from_claims(_decode_token(token))
+        if principal is not None:
+            if not principal.is_active:
+                raise _credentials_exception()
+            return principal
+    user = await check_token(session=session, token=token)
     return user
 
 
-async def get_current_user_with_refresh_token(request: Request) -> User:
+async def get_current_user_with_refresh_token(
+    request: Request, session: AsyncSession = Depends(db_helper.session_dependency)
+) -> User:
     token: str = request.cookies.get("refresh_token")
-    user = await check_token(token=token)
+    user = await check_token(session=session, token=token)
     return user
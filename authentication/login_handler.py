@@ -1,17 +1,22 @@
 from datetime import timedelta, datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from authentication.auth import (
+    access_token_data,
     authenticate_user,
     get_current_user,
     get_current_user_with_refresh_token,
+    oauth2_scheme,
+    revoke_tokens,
 )
 from authentication.schemas import Token
 from authentication.security import create_access_token, create_refresh_token
 from config import settings
+from database.db_helper import db_helper
 from database.models import User
 
 login_router = APIRouter(tags=["Login"], prefix="/login")
@@ -19,7 +24,8 @@ login_router = APIRouter(tags=["Login"], prefix="/login")
 
 @login_router.post("/login", status_code=status.HTTP_200_OK)
 async def login_for_access_token(
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()], response: Response
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    response: Response,
 ) -> Token:
     user = await authenticate_user(form_data.username, form_data.password)
     if not user:
@@ -29,7 +35,7 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
     access_token = create_access_token(
-        data={"sub": user.email},
+        data=access_token_data(user),
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
     )
     refresh_token = create_refresh_token(
@@ -49,7 +55,7 @@ async def refresh_access_token(
     current_user: Annotated[User, Depends(get_current_user_with_refresh_token)],
 ):
     access_token = create_access_token(
-        data={"sub": current_user.email},
+        data=access_token_data(current_user),
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
     )
     refresh_token = create_refresh_token(
@@ -65,8 +71,13 @@ async def refresh_access_token(
 
 @login_router.post("/logout", status_code=status.HTTP_200_OK)
 async def logout(
-    response: Response, current_user: Annotated[User, Depends(get_current_user)]
+    request: Request,
+    response: Response,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(db_helper.session_dependency)],
 ):
+    await revoke_tokens(session, [token, request.cookies.get("refresh_token")])
     response.delete_cookie("access_token")
     response.delete_cookie("refresh_token")
     return {"status": "Logout successfully"}
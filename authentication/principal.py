@@ -0,0 +1,17 @@
+from database.models.user import Role
+
+
+class Principal:
+    def __init__(self, id: int, email: str, role: list[str], is_active: bool):
+        self.id = id
+        self.email = email
+        self.role = role
+        self.is_active = is_active
+
+    @property
+    def is_superadmin(self) -> bool:
+        return Role.SUPERADMIN in self.role
+
+    @property
+    def is_admin(self) -> bool:
+        return Role.ADMIN in self.role
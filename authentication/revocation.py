@@ -0,0 +1,98 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from database.models import RevokedToken
+
+# Revocations committed slightly out of revoked_at order are picked up by
+# re-reading this window behind the newest row already seen.
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+
+def _expires_at(payload: dict) -> datetime:
+    return datetime.utcfromtimestamp(payload["exp"])
+
+
+class RevocationList:
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._revoked: dict[str, datetime] = {}
+        self._watermark: datetime | None = None
+        self._refreshed_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._refreshed_at is not None
+
+    def is_revoked(self, jti: str | None) -> bool:
+        # Until the first refresh has loaded the list, nothing is trusted.
+        if not self.loaded:
+            return True
+        return jti is not None and jti in self._revoked
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < self.refresh_seconds
+        )
+
+    async def refresh(self, session: AsyncSession) -> None:
+        if self._is_fresh():
+            return
+        # Once a list is loaded, a slightly stale one is fine while another
+        # request refreshes it; before that, every caller waits for the load.
+        if self.loaded and self._lock.locked():
+            return
+
+        async with self._lock:
+            if self._is_fresh():
+                return
+            now = datetime.utcnow()
+            query = select(
+                RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at
+            ).where(RevokedToken.expires_at > now)
+            if self._watermark is not None:
+                query = query.where(
+                    RevokedToken.revoked_at > self._watermark - REFRESH_OVERLAP
+                )
+
+            for jti, expires_at, revoked_at in await session.execute(query):
+                self._revoked[jti] = expires_at
+                if self._watermark is None or revoked_at > self._watermark:
+                    self._watermark = revoked_at
+
+            self._revoked = {
+                jti: expires_at
+                for jti, expires_at in self._revoked.items()
+                if expires_at > now
+            }
+            self._refreshed_at = time.monotonic()
+
+    async def revoke(self, session: AsyncSession, payloads: list[dict]) -> None:
+        values = [
+            {"jti": payload["jti"], "expires_at": _expires_at(payload)}
+            for payload in payloads
+            if "jti" in payload
+        ]
+        if not values:
+            return
+
+        await session.execute(
+            insert(RevokedToken).values(values).on_conflict_do_nothing()
+        )
+        await session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow())
+        )
+        for value in values:
+            self._revoked[value["jti"]] = value["expires_at"]
+
+
+revocation_list = RevocationList(
+    refresh_seconds=settings.TOKEN_REVOCATION_REFRESH_SECONDS
+)
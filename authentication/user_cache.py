@@ -0,0 +1,58 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from cache import TTLCache
+from config import settings
+from database.models import User
+
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_user(email: str) -> User | None:
+    snapshot = user_cache.get(email)
+    if snapshot is not None:
+        return User(**{**snapshot, "role": list(snapshot["role"])})
+
+
+def cache_user(user: User) -> None:
+    user_cache.set(
+        user.email,
+        {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "role": tuple(user.role),
+            "is_active": user.is_active,
+        },
+    )
+
+
+def invalidate_cached_users(user_ids: set[int]) -> None:
+    if not user_ids:
+        return
+    for email, snapshot in user_cache.items():
+        if snapshot["id"] in user_ids:
+            user_cache.pop(email)
+
+
+PENDING_INVALIDATIONS = "invalidate_user_ids"
+
+
+def invalidate_cached_users_on_commit(
+    session: AsyncSession, user_ids: set[int]
+) -> None:
+    # Evicting before commit would let a concurrent request re-cache the old row.
+    session.info.setdefault(PENDING_INVALIDATIONS, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    invalidate_cached_users(session.info.pop(PENDING_INVALIDATIONS, set()))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session: Session, previous_transaction) -> None:
+    session.info.pop(PENDING_INVALIDATIONS, None)
@@ -0,0 +1,38 @@
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from database.models import User
+from database.seed import seed
+
+EMAIL_TEMPLATE = "bench_{}@example.com"
+PASSWORD = "benchmark"
+
+
+async def seed_dataset(
+    engine: AsyncEngine, users: int, articles: int, days: int, rng_seed: int = 0
+) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(
+            delete(User).where(User.email.like(EMAIL_TEMPLATE.format("%")))
+        )
+    await seed(
+        engine,
+        users=users,
+        articles=articles,
+        days=days,
+        password=PASSWORD,
+        email_template=EMAIL_TEMPLATE,
+        rng_seed=rng_seed,
+    )
+
+
+async def top_author(engine: AsyncEngine) -> tuple[str, str]:
+    query = (
+        select(User.email, User.username)
+        .where(User.email.like(EMAIL_TEMPLATE.format("%")))
+        .order_by(User.id)
+        .limit(1)
+    )
+    async with engine.connect() as connection:
+        email, username = (await connection.execute(query)).one()
+    return email, username
@@ -0,0 +1,216 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import date, timedelta
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmark.dataset import PASSWORD, seed_dataset, top_author
+from database.db_helper import db_helper
+from main import create_app
+
+
+def make_scenarios(days: int, email: str, username: str) -> dict[str, dict]:
+    today = date.today()
+    week_ago = (today - timedelta(days=7)).isoformat()
+    quarter_ago = (today - timedelta(days=min(days, 90))).isoformat()
+    articles = {
+        "articles": {},
+        "articles_summary": {"fields": "summary"},
+        "articles_username": {"username": username},
+        "articles_date": {"date": week_ago},
+        "articles_date_range": {"date_from": quarter_ago, "date_to": today.isoformat()},
+        "articles_username_date_range": {
+            "username": username,
+            "date_from": quarter_ago,
+            "date_to": today.isoformat(),
+        },
+        "articles_deep_page": {"page": 50, "limit": 20},
+        "articles_total_exact": {"total": "exact"},
+        "articles_total_estimated": {"date_from": quarter_ago, "total": "estimated"},
+    }
+    scenarios = {
+        name: {"method": "GET", "url": "/article/", "params": params}
+        for name, params in articles.items()
+    }
+    scenarios["login"] = {
+        "method": "POST",
+        "url": "/login/login",
+        "data": {"username": email, "password": PASSWORD},
+    }
+    scenarios["refresh"] = {"method": "POST", "url": "/login/refresh", "auth": True}
+    return scenarios
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": percentiles[49] * 1000,
+        "p95_ms": percentiles[94] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+    }
+
+
+def request_kwargs(scenario: dict, cookies: str) -> dict:
+    kwargs = {
+        key: scenario[key]
+        for key in ("method", "url", "params", "data")
+        if key in scenario
+    }
+    if scenario.get("auth"):
+        kwargs["headers"] = {"Cookie": cookies}
+    return kwargs
+
+
+async def drive(
+    client: AsyncClient, request: dict, requests: int, concurrency: int
+) -> tuple[list[float], int]:
+    latencies, errors = [], 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.request(**request)
+            latencies.append(time.perf_counter() - started)
+            client.cookies.clear()
+            if response.status_code >= 400:
+                errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def dispose_engines() -> None:
+    for engine in db_helper.engines.values():
+        await engine.dispose()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    email, username = await top_author(db_helper.engine)
+    scenarios = make_scenarios(args.days, email, username)
+    if args.scenario:
+        scenarios = {
+            name: scenario
+            for name, scenario in scenarios.items()
+            if name in args.scenario
+        }
+
+    results = {}
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        while not app.state.ready:
+            await asyncio.sleep(0.1)
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            login = await client.post(
+                "/login/login",
+                data={"username": email, "password": PASSWORD},
+            )
+            login.raise_for_status()
+            client.cookies.clear()
+            cookies = f"refresh_token={login.json()['refresh_token']}"
+
+            for name, scenario in scenarios.items():
+                request = request_kwargs(scenario, cookies)
+                await drive(client, request, args.warmup, args.concurrency)
+                started = time.perf_counter()
+                latencies, errors = await drive(
+                    client, request, args.requests, args.concurrency
+                )
+                results[name] = summarize(
+                    latencies, errors, time.perf_counter() - started
+                )
+                print(
+                    f"{name:>30}: p50 {results[name]['p50_ms']:8.2f} ms"
+                    f"  p95 {results[name]['p95_ms']:8.2f} ms"
+                    f"  p99 {results[name]['p99_ms']:8.2f} ms"
+                    f"  {results[name]['throughput_rps']:8.1f} req/s"
+                    f"  errors {results[name]['errors']}"
+                )
+
+    return {
+        "settings": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "days": args.days,
+        },
+        "results": results,
+    }
+
+
+async def seed(args: argparse.Namespace) -> None:
+    await seed_dataset(
+        db_helper.engine,
+        users=args.users,
+        articles=args.articles,
+        days=args.days,
+        rng_seed=args.seed,
+    )
+    await dispose_engines()
+
+
+def compare(baseline_path: str, candidate_path: str) -> None:
+    with open(baseline_path) as file:
+        baseline = json.load(file)["results"]
+    with open(candidate_path) as file:
+        candidate = json.load(file)["results"]
+
+    for name in baseline:
+        if name not in candidate:
+            continue
+        deltas = []
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps"):
+            before, after = baseline[name][metric], candidate[name][metric]
+            change = (after - before) / before * 100 if before else 0.0
+            deltas.append(f"{metric} {before:.2f} -> {after:.2f} ({change:+.1f}%)")
+        print(f"{name:>30}: " + "  ".join(deltas))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark API endpoints in-process.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="Load the benchmark dataset.")
+    seed_parser.add_argument("--users", type=int, default=1000)
+    seed_parser.add_argument("--articles", type=int, default=100_000)
+    seed_parser.add_argument("--days", type=int, default=365)
+    seed_parser.add_argument("--seed", type=int, default=0)
+
+    run_parser = commands.add_parser("run", help="Run the endpoint scenarios.")
+    run_parser.add_argument("--requests", type=int, default=500)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--warmup", type=int, default=20)
+    run_parser.add_argument("--days", type=int, default=365)
+    run_parser.add_argument("--scenario", action="append")
+    run_parser.add_argument("--output")
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+
+    args = parser.parse_args()
+    if args.command == "seed":
+        asyncio.run(seed(args))
+    elif args.command == "run":
+        results = asyncio.run(run(args))
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(results, file, indent=2)
+    else:
+        compare(args.baseline, args.candidate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import timeit
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Select, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.orm import joinedload
+from sqlalchemy.util import LRUCache
+
+from api.article.filter_query import query_articles, summary_options
+from database.models import Article, User
+
+SHAPES = {
+    "no_filters": dict(filter_username=None, author_id=None, date_from=None),
+    "username": dict(filter_username="alex_smith1", author_id=None, date_from=None),
+    "author": dict(filter_username=None, author_id=42, date_from=None),
+    "username_date": dict(
+        filter_username="alex_smith1", author_id=None, date_from=date(2024, 1, 1)
+    ),
+}
+
+
+def select_articles(
+    filter_username: str | None,
+    author_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+    order: str,
+    page: int,
+    limit: int,
+    after_id: int | None = None,
+    excerpt_length: int | None = None,
+) -> Select:
+    # Plain Select composition, as the filter builders were before lambda_stmt.
+    query = select(Article).options(joinedload(Article.user))
+    if filter_username is not None:
+        query = query.join(User).where(User.username == filter_username)
+    if author_id is not None:
+        query = query.where(Article.user_id == author_id)
+    if date_from is not None:
+        query = query.where(Article.created_at >= datetime.combine(date_from, time.min))
+    if date_to is not None:
+        query = query.where(
+            Article.created_at < datetime.combine(date_to + timedelta(days=1), time.min)
+        )
+    if order == "desc":
+        query = query.order_by(Article.id.desc())
+        if after_id is not None:
+            query = query.where(Article.id < after_id)
+    else:
+        query = query.order_by(Article.id)
+        if after_id is not None:
+            query = query.where(Article.id > after_id)
+    if after_id is None:
+        query = query.offset((page - 1) * limit)
+    query = query.limit(limit)
+    if excerpt_length is not None:
+        query = query.options(*summary_options(excerpt_length))
+    return query
+
+
+def compile_uncached(build, dialect, arguments: dict) -> None:
+    build(**arguments).compile(dialect=dialect)
+
+
+def compile_cached(build, dialect, cache: LRUCache, arguments: dict) -> None:
+    compiled, extracted, _ = build(**arguments)._compile_w_cache(
+        dialect, compiled_cache=cache, column_keys=[]
+    )
+    compiled.construct_params(extracted_parameters=extracted)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-request statement build and compile overhead."
+    )
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    dialect = PGDialect_asyncpg()
+    for shape, filters in SHAPES.items():
+        arguments = dict(
+            filters, date_to=None, order="asc", page=2, limit=20, excerpt_length=200
+        )
+        runs = {
+            "select, no cache": lambda: compile_uncached(
+                select_articles, dialect, arguments
+            ),
+            "select, cached": lambda cache=LRUCache(100): compile_cached(
+                select_articles, dialect, cache, arguments
+            ),
+            "lambda, cached": lambda cache=LRUCache(100): compile_cached(
+                query_articles, dialect, cache, arguments
+            ),
+        }
+        for name, run in runs.items():
+            seconds = min(timeit.repeat(run, number=args.number, repeat=5))
+            print(f"{shape:>14} {name:>17}: {seconds / args.number * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
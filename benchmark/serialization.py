@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+import json
+import timeit
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+
+from api.article.schemas import ShowArticle
+
+
+def make_articles(count: int, content_length: int) -> list[SimpleNamespace]:
+    created_at = datetime(2024, 1, 21, 12, 0, 0)
+    return [
+        SimpleNamespace(
+            id=number,
+            title=f"Article {number}",
+            content="x" * content_length,
+            created_at=created_at + timedelta(minutes=number),
+            user_id=number % 50,
+            version=1,
+            user=SimpleNamespace(username=f"user_{number % 50}"),
+        )
+        for number in range(count)
+    ]
+
+
+def current_path(
+    articles: list[SimpleNamespace], field, loop: asyncio.AbstractEventLoop
+) -> bytes:
+    content = [
+        ShowArticle(
+            id=article.id,
+            title=article.title,
+            content=article.content,
+            created_at=article.created_at,
+            user_id=article.user_id,
+            username=article.user.username,
+        )
+        for article in articles
+    ]
+    serialized = loop.run_until_complete(
+        serialize_response(field=field, response_content=content, is_coroutine=True)
+    )
+    return JSONResponse(content=serialized).body
+
+
+def fast_path(articles: list[SimpleNamespace], adapter: TypeAdapter) -> bytes:
+    content = [ShowArticle.model_validate(article) for article in articles]
+    return ORJSONResponse(content=adapter.dump_python(content)).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare list response serialization paths."
+    )
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--content-length", type=int, default=2000)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    articles = make_articles(args.items, args.content_length)
+    field = create_response_field(name="response", type_=list[ShowArticle])
+    adapter = TypeAdapter(list[ShowArticle])
+    loop = asyncio.new_event_loop()
+    assert json.loads(current_path(articles, field, loop)) == json.loads(
+        fast_path(articles, adapter)
+    )
+
+    for name, run in (
+        ("current", lambda: current_path(articles, field, loop)),
+        ("fast", lambda: fast_path(articles, adapter)),
+    ):
+        seconds = min(timeit.repeat(run, number=args.number, repeat=5)) / args.number
+        print(f"{name:>8}: {seconds * 1000:.3f} ms per {args.items}-item page")
+
+
+if __name__ == "__main__":
+    main()
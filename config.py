@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,10 +14,36 @@ class Settings(BaseSettings):
     DB_PASS: str
     DB_NAME: str
     ECHO: bool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DB_PGBOUNCER: bool = False
+    DB_WARMUP_CONNECTIONS: int = 5
+    DB_REPLICA_URLS: list[str] = []
+    DB_REPLICA_STRATEGY: Literal["round_robin", "least_busy"] = "round_robin"
+    DB_REPLICA_RETRY_SECONDS: float = 30
+    DB_READ_YOUR_WRITES_SECONDS: float = 5
+    SQL_SLOW_QUERY_MS: float = 200
+    SQL_MAX_STATEMENTS_PER_REQUEST: int = 0
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_MINUTES: int
+    AUTH_CLAIMS_MODE: bool = False
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = 5
+    PASSWORD_HASH_WORKERS: int = 4
+    USER_CACHE_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: float = 30
+    ARTICLE_BULK_MAX_SIZE: int = 1000
+    ARTICLE_EXPORT_BATCH_SIZE: int = 1000
+    ARTICLE_CACHE_MAX_AGE: int = 0
+    ARTICLE_EXCERPT_LENGTH: int = 200
+    ARTICLE_COUNT_CACHE_SIZE: int = 1024
+    ARTICLE_COUNT_CACHE_TTL_SECONDS: float = 10
+    RESPONSE_CLASS: Literal["json", "orjson"] = "json"
 
     @property
     def DB_URL(self):
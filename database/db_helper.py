@@ -1,18 +1,219 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import hashlib
+import hmac
+import itertools
+import secrets
+import time
+from typing import AsyncGenerator, Callable, Coroutine, Any
+from uuid import uuid4
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    async_sessionmaker,
+    AsyncSession,
+    AsyncEngine,
+)
 
 from config import settings
 
+PRIMARY_COOKIE = "db_primary_until"
+READ_ONLY_METHODS = ("GET", "HEAD")
+
+
+def _is_connection_error(error: Exception) -> bool:
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated
+    return True
+
+
+class ReplicaUnavailableError(Exception):
+    pass
+
+
+class ReplicaFallbackRoute(APIRoute):
+    """Re-runs a read on the primary when its replica fails mid-request."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except ReplicaUnavailableError:
+                request.state.db_primary = True
+                return await handler(request)
+
+        return route_handler
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    waiting = 0
+    wait_seconds_total = 0.0
+
+    def _do_get(self):
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.waiting -= 1
+            self.wait_seconds_total += time.perf_counter() - started
+
 
 class DatabaseHelper:
-    def __init__(self, url: str, echo: bool = False):
-        self.engine = create_async_engine(
-            url=url,
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        prepared_statement_cache_size: int = 100,
+        pgbouncer: bool = False,
+        replica_urls: list[str] | None = None,
+        replica_strategy: str = "round_robin",
+        replica_retry_seconds: float = 30,
+        read_your_writes_seconds: float = 5,
+        cookie_secret: str | None = None,
+    ):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.replica_strategy = replica_strategy
+        self.replica_retry_seconds = replica_retry_seconds
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._cookie_key = (cookie_secret or secrets.token_hex(32)).encode()
+
+        connect_args = {"prepared_statement_cache_size": prepared_statement_cache_size}
+        if pgbouncer:
+            connect_args = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        engine_kwargs = dict(
             echo=echo,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args,
         )
 
+        self.engine = create_async_engine(url=url, **engine_kwargs)
+        self.replicas = [
+            create_async_engine(url=replica_url, **engine_kwargs)
+            for replica_url in replica_urls or []
+        ]
+        self._replica_counter = itertools.count()
+        self._unhealthy_until: dict[AsyncEngine, float] = {}
+
         self.session_factory = async_sessionmaker(
             bind=self.engine, autoflush=False, autocommit=False, expire_on_commit=False
         )
 
+    @property
+    def engines(self) -> dict[str, AsyncEngine]:
+        engines = {"primary": self.engine}
+        for number, replica in enumerate(self.replicas):
+            engines[f"replica_{number}"] = replica
+        return engines
+
+    def pool_status(self, engine: AsyncEngine | None = None) -> dict[str, float]:
+        pool = (engine or self.engine).pool
+        return {
+            "size": pool.size(),
+            "max_overflow": self.max_overflow,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "waiting": getattr(pool, "waiting", 0),
+            "wait_seconds_total": getattr(pool, "wait_seconds_total", 0.0),
+        }
+
+    def mark_unhealthy(self, replica: AsyncEngine) -> None:
+        self._unhealthy_until[replica] = time.monotonic() + self.replica_retry_seconds
+
+    def pick_replica(self) -> AsyncEngine | None:
+        now = time.monotonic()
+        healthy = [
+            replica
+            for replica in self.replicas
+            if self._unhealthy_until.get(replica, 0) <= now
+        ]
+        if not healthy:
+            return None
+        if self.replica_strategy == "least_busy":
+            return min(healthy, key=lambda replica: replica.pool.checkedout())
+        return healthy[next(self._replica_counter) % len(healthy)]
+
+    def _sign(self, value: str) -> str:
+        return hmac.new(self._cookie_key, value.encode(), hashlib.sha256).hexdigest()
+
+    def _reads_own_writes(self, request: Request) -> bool:
+        value, _, signature = request.cookies.get(PRIMARY_COOKIE, "").rpartition(":")
+        if not hmac.compare_digest(signature, self._sign(value)):
+            return False
+        try:
+            primary_until = float(value)
+        except ValueError:
+            return False
+        return primary_until > time.time()
+
+    def engine_for_request(self, request: Request, response: Response) -> AsyncEngine:
+        if not self.replicas:
+            return self.engine
+
+        if request.method not in READ_ONLY_METHODS:
+            primary_until = str(time.time() + self.read_your_writes_seconds)
+            response.set_cookie(
+                key=PRIMARY_COOKIE,
+                value=f"{primary_until}:{self._sign(primary_until)}",
+                max_age=int(self.read_your_writes_seconds) + 1,
+                httponly=True,
+            )
+            return self.engine
+
+        if getattr(request.state, "db_primary", False):
+            return self.engine
+        if self._reads_own_writes(request):
+            return self.engine
+        return self.pick_replica() or self.engine
+
+    async def session_dependency(
+        self, request: Request, response: Response
+    ) -> AsyncGenerator[AsyncSession, None]:
+        engine = self.engine_for_request(request, response)
+        async with self.session_factory(bind=engine) as session:
+            try:
+                async with session.begin():
+                    yield session
+            except (OSError, DBAPIError) as error:
+                if engine is not self.engine and _is_connection_error(error):
+                    self.mark_unhealthy(engine)
+                    raise ReplicaUnavailableError from error
+                raise
+
 
-db_helper = DatabaseHelper(url=settings.DB_URL, echo=settings.ECHO)
+db_helper = DatabaseHelper(
+    url=settings.DB_URL,
+    echo=settings.ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    prepared_statement_cache_size=settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    pgbouncer=settings.DB_PGBOUNCER,
+    replica_urls=settings.DB_REPLICA_URLS,
+    replica_strategy=settings.DB_REPLICA_STRATEGY,
+    replica_retry_seconds=settings.DB_REPLICA_RETRY_SECONDS,
+    read_your_writes_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+    cookie_secret=settings.SECRET_KEY,
+)
@@ -1,5 +1,15 @@
-__all__ = ("Base", "User", "Article")
+__all__ = (
+    "Base",
+    "User",
+    "Article",
+    "ArticleCounter",
+    "ArticleDailyStats",
+    "RevokedToken",
+)
 
 from .base import Base
 from .user import User
 from .article import Article
+from .article_counter import ArticleCounter
+from .article_daily_stats import ArticleDailyStats
+from .revoked_token import RevokedToken
@@ -1,18 +1,28 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, String, func, ForeignKey, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Integer, String, func, ForeignKey, Text, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship, query_expression
 
 from database.models.base import Base
 
 if TYPE_CHECKING:
     from .user import User
 
+SEARCH_CONFIG = "english"
+TITLE_MAX_LENGTH = 100
+
 
 class Article(Base):
+    __table_args__ = (
+        Index("ix_article_created_at", "created_at"),
+        Index("ix_article_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_article_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    title: Mapped[str] = mapped_column(String(100))
+    title: Mapped[str] = mapped_column(String(TITLE_MAX_LENGTH))
     content: Mapped[str] = mapped_column(Text, default="", server_default="")
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), default=datetime.utcnow
@@ -20,5 +30,16 @@ class Article(Base):
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("user.id", ondelete="CASCADE")
     )
+    version: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(title, '') || ' ' || coalesce(content, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+    excerpt: Mapped[str | None] = query_expression()
 
     user: Mapped["User"] = relationship(back_populates="articles")
@@ -0,0 +1,11 @@
+from sqlalchemy import Integer, BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.models.base import Base
+
+
+class ArticleCounter(Base):
+    __tablename__ = "article_counter"
+
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
@@ -0,0 +1,17 @@
+from datetime import date
+
+from sqlalchemy import Integer, BigInteger, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.models.base import Base
+
+
+class ArticleDailyStats(Base):
+    __tablename__ = "article_daily_stats"
+    __table_args__ = (Index("ix_article_daily_stats_day", "day"),)
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
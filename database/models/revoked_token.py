@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlalchemy import String, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.models.base import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_token"
+    __table_args__ = (Index("ix_revoked_token_revoked_at", "revoked_at"),)
+
+    jti: Mapped[str] = mapped_column(String(32), primary_key=True)
+    expires_at: Mapped[datetime]
+    revoked_at: Mapped[datetime] = mapped_column(server_default=func.now())
@@ -19,7 +19,7 @@ class Role(str, Enum):
 
 class User(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    username: Mapped[str]
+    username: Mapped[str] = mapped_column(index=True)
     email: Mapped[str] = mapped_column(String, unique=True)
     role: Mapped[list[str]] = mapped_column(ARRAY(String), default=[Role.USER])
     hashed_password: Mapped[str] = mapped_column(String(length=1024))
@@ -34,11 +34,3 @@ class User(Base):
     @property
     def is_admin(self) -> bool:
         return Role.ADMIN in self.role
-
-    def enrich_admin_roles_by_admin_role(self):
-        if not self.is_admin:
-            return list({*self.role, Role.ADMIN})
-
-    def remove_admin_privileges_from_model(self):
-        if self.is_admin:
-            return list({role for role in self.role if role != Role.ADMIN})
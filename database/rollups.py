@@ -0,0 +1,32 @@
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.db_helper import db_helper
+
+REBUILD_STATEMENTS = (
+    "LOCK TABLE article IN SHARE MODE",
+    "DELETE FROM article_counter",
+    "INSERT INTO article_counter (user_id, count) "
+    "SELECT user_id, count(*) FROM article GROUP BY user_id",
+    "DELETE FROM article_daily_stats",
+    "INSERT INTO article_daily_stats (user_id, day, count) "
+    "SELECT user_id, created_at::date, count(*) FROM article GROUP BY 1, 2",
+)
+
+
+async def rebuild_article_rollups(session: AsyncSession) -> None:
+    for statement in REBUILD_STATEMENTS:
+        await session.execute(text(statement))
+
+
+async def main() -> None:
+    async with db_helper.session_factory() as session:
+        async with session.begin():
+            await rebuild_article_rollups(session)
+    await db_helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
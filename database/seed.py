@@ -0,0 +1,212 @@
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from authentication.security import get_password_hash
+from database.db_helper import db_helper
+from database.models import Article, User
+from database.models.user import Role
+from database.rollups import rebuild_article_rollups
+
+FIRST_NAMES = (
+    "alex maria ivan olga john anna peter elena david sofia michael irina "
+    "daniel natalia james kate sergey laura mark julia"
+).split()
+LAST_NAMES = (
+    "smith ivanov brown petrova garcia novak miller kuznetsov wilson "
+    "sokolova moore popov taylor lebedeva clark volkov"
+).split()
+WORDS = (
+    "database index query latency python release cache async postgres "
+    "server client request response deploy metrics article review team "
+    "design network storage memory thread benchmark schema migration "
+    "cluster replica token session"
+).split()
+
+USER_COLUMNS = ("id", "username", "email", "role", "hashed_password", "is_active")
+ARTICLE_COLUMNS = ("id", "title", "content", "created_at", "user_id", "version")
+DEFAULT_EMAIL_TEMPLATE = "user{}@example.com"
+
+
+def batched(records: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def generate_users(
+    rng: random.Random,
+    user_ids: range,
+    hashed_password: str,
+    email_template: str,
+) -> Iterator[tuple]:
+    for user_id in user_ids:
+        username = f"{rng.choice(FIRST_NAMES)}_{rng.choice(LAST_NAMES)}{user_id}"
+        email = email_template.format(user_id)
+        yield user_id, username, email, [Role.USER.value], hashed_password, True
+
+
+def generate_articles(
+    rng: random.Random,
+    article_ids: range,
+    user_ids: range,
+    days: int,
+    zipf_exponent: float,
+    content_words: int,
+) -> Iterator[tuple]:
+    # Author popularity follows rank ** -s, so the first users own most articles.
+    cum_weights = list(
+        itertools.accumulate(
+            rank**-zipf_exponent for rank in range(1, len(user_ids) + 1)
+        )
+    )
+    newest = datetime.utcnow()
+    span = timedelta(days=days).total_seconds()
+    for article_id in article_ids:
+        (user_id,) = rng.choices(user_ids, cum_weights=cum_weights)
+        # Triangular offsets make recent days denser than old ones.
+        created_at = newest - timedelta(seconds=rng.triangular(0, span, 0))
+        title = " ".join(rng.choices(WORDS, k=4)).capitalize()
+        content = " ".join(rng.choices(WORDS, k=content_words))
+        yield article_id, title, content, created_at, user_id, 1
+
+
+async def _next_id(connection: AsyncConnection, table: str) -> int:
+    return await connection.scalar(
+        text(f"SELECT coalesce(max(id), 0) + 1 FROM {table}")
+    )
+
+
+async def _reset_sequence(connection: AsyncConnection, table: str) -> None:
+    await connection.execute(
+        text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT max(id) FROM {table}))"
+        )
+    )
+
+
+async def _copy(
+    connection: AsyncConnection,
+    table: str,
+    columns: tuple[str, ...],
+    records: Iterable[tuple],
+    batch_size: int,
+) -> None:
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    loaded = 0
+    started = time.perf_counter()
+    for batch in batched(records, batch_size):
+        await driver_connection.copy_records_to_table(
+            table, records=batch, columns=columns
+        )
+        loaded += len(batch)
+        rate = loaded / (time.perf_counter() - started)
+        print(f"{table}: {loaded} rows ({rate:.0f} rows/s)")
+
+
+async def seed(
+    engine: AsyncEngine,
+    users: int,
+    articles: int,
+    days: int = 365,
+    password: str = "password",
+    email_template: str = DEFAULT_EMAIL_TEMPLATE,
+    batch_size: int = 50_000,
+    zipf_exponent: float = 1.1,
+    content_words: int = 60,
+    defer_indexes: bool = False,
+    rng_seed: int | None = None,
+) -> range:
+    rng = random.Random(rng_seed)
+    hashed_password = get_password_hash(password)
+    indexes = sorted(Article.__table__.indexes, key=lambda index: index.name)
+
+    async with engine.begin() as connection:
+        await connection.execute(text('LOCK TABLE "user", article IN EXCLUSIVE MODE'))
+        first_user_id = await _next_id(connection, '"user"')
+        first_article_id = await _next_id(connection, "article")
+        user_ids = range(first_user_id, first_user_id + users)
+        article_ids = range(first_article_id, first_article_id + articles)
+
+        if defer_indexes:
+            for index in indexes:
+                await connection.run_sync(index.drop)
+
+        await _copy(
+            connection,
+            User.__tablename__,
+            USER_COLUMNS,
+            generate_users(rng, user_ids, hashed_password, email_template),
+            batch_size,
+        )
+        await _copy(
+            connection,
+            Article.__tablename__,
+            ARTICLE_COLUMNS,
+            generate_articles(
+                rng, article_ids, user_ids, days, zipf_exponent, content_words
+            ),
+            batch_size,
+        )
+
+        if defer_indexes:
+            for index in indexes:
+                await connection.run_sync(index.create)
+
+        await _reset_sequence(connection, '"user"')
+        await _reset_sequence(connection, "article")
+        async with AsyncSession(bind=connection) as session:
+            await rebuild_article_rollups(session)
+
+    return user_ids
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load generated users and articles with COPY."
+    )
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--email-template", default=DEFAULT_EMAIL_TEMPLATE)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--content-words", type=int, default=60)
+    parser.add_argument(
+        "--defer-indexes",
+        action="store_true",
+        help="Drop article indexes during the load and rebuild them afterwards",
+    )
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    await seed(
+        db_helper.engine,
+        users=args.users,
+        articles=args.articles,
+        days=args.days,
+        password=args.password,
+        email_template=args.email_template,
+        batch_size=args.batch_size,
+        zipf_exponent=args.zipf_exponent,
+        content_words=args.content_words,
+        defer_indexes=args.defer_indexes,
+        rng_seed=args.seed,
+    )
+    await db_helper.engine.dispose()
+    print(f"Seeded in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
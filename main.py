@@ -1,12 +1,64 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 
 from api.article.handlers import router as article_router
+from api.responses import default_response_class
 from api.user.handlers import router as user_router
+from api.warmup import warm_up
 from authentication.login_handler import login_router
+from config import settings
+from database.db_helper import db_helper
+from monitoring.handlers import router as monitoring_router
+from monitoring.middleware import MetricsMiddleware
+from monitoring.sql import QueryStatsMiddleware, instrument_engine
+
+logger = logging.getLogger(__name__)
+
+WARMUP_RETRY_SECONDS = 5
+
+
+async def _warm_up_until_ready(app: FastAPI) -> None:
+    while True:
+        try:
+            await warm_up(db_helper, connections=settings.DB_WARMUP_CONNECTIONS)
+        except (OSError, SQLAlchemyError):
+            logger.exception("Warm-up failed, retrying in %s s", WARMUP_RETRY_SECONDS)
+            await asyncio.sleep(WARMUP_RETRY_SECONDS)
+        else:
+            app.state.ready = True
+            return
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+    warmup_task = asyncio.create_task(_warm_up_until_ready(app))
+    yield
+    app.state.ready = False
+    warmup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup_task
+    for engine in db_helper.engines.values():
+        await engine.dispose()
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(default_response_class=default_response_class, lifespan=lifespan)
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(MetricsMiddleware)
+
+    for engine in db_helper.engines.values():
+        instrument_engine(engine)
 
-app = FastAPI()
+    app.include_router(login_router)
+    app.include_router(user_router)
+    app.include_router(article_router)
+    app.include_router(monitoring_router)
+    return app
 
 
-app.include_router(login_router)
-app.include_router(user_router)
-app.include_router(article_router)
+app = create_app()
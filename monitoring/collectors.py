@@ -0,0 +1,86 @@
+from authentication.security import password_hasher
+from authentication.user_cache import user_cache
+from database.db_helper import db_helper
+from monitoring.metrics import CallbackMetric, Gauge, Histogram, registry
+
+request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        labelnames=("method", "route", "status"),
+    )
+)
+requests_in_progress = registry.register(
+    Gauge(
+        "http_requests_in_progress",
+        "HTTP requests currently being served.",
+        labelnames=("method",),
+    )
+)
+
+
+def _pool_stat(name: str):
+    def collect() -> dict[tuple, float]:
+        return {
+            (engine_name,): db_helper.pool_status(engine)[name]
+            for engine_name, engine in db_helper.engines.items()
+        }
+
+    return collect
+
+
+for _name, _documentation, _type in (
+    ("size", "Configured connection pool size.", "gauge"),
+    ("checked_out", "Connections currently checked out of the pool.", "gauge"),
+    ("checked_in", "Idle connections held by the pool.", "gauge"),
+    ("overflow", "Overflow connections currently open.", "gauge"),
+    ("waiting", "Tasks currently waiting for a pool connection.", "gauge"),
+    ("wait_seconds_total", "Total time spent waiting for pool checkout.", "counter"),
+):
+    registry.register(
+        CallbackMetric(
+            f"db_pool_{_name}",
+            _documentation,
+            _pool_stat(_name),
+            labelnames=("engine",),
+            type=_type,
+        )
+    )
+
+registry.register(
+    CallbackMetric(
+        "password_hasher_pending",
+        "Password hash/verify calls submitted and not yet finished.",
+        lambda: {(): password_hasher.pending},
+    )
+)
+registry.register(
+    CallbackMetric(
+        "password_hasher_queue_depth",
+        "Password hash/verify calls waiting for a worker thread.",
+        lambda: {(): password_hasher.queue_depth},
+    )
+)
+registry.register(
+    CallbackMetric(
+        "user_cache_hits_total",
+        "Token user cache hits.",
+        lambda: {(): user_cache.hits},
+        type="counter",
+    )
+)
+registry.register(
+    CallbackMetric(
+        "user_cache_misses_total",
+        "Token user cache misses.",
+        lambda: {(): user_cache.misses},
+        type="counter",
+    )
+)
+registry.register(
+    CallbackMetric(
+        "user_cache_entries",
+        "Entries currently held in the token user cache.",
+        lambda: {(): len(user_cache)},
+    )
+)
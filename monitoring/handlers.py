@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import PlainTextResponse
+
+from monitoring.metrics import registry
+
+router = APIRouter(tags=["Monitoring"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+
+@router.get("/health/ready", include_in_schema=False)
+async def readiness(request: Request, response: Response) -> dict:
+    if getattr(request.app.state, "ready", False):
+        return {"status": "ready"}
+    response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"status": "warming up"}
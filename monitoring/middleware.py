@@ -0,0 +1,49 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from monitoring.collectors import requests_in_progress, request_duration
+
+UNMATCHED_ROUTE = "unmatched"
+OTHER_METHOD = "other"
+KNOWN_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE")
+)
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Clients can send any method token, so unknown ones share one label.
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else OTHER_METHOD
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        requests_in_progress.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            requests_in_progress.dec(method)
+            request_duration.observe(
+                time.perf_counter() - started,
+                method,
+                _route_template(scope),
+                str(status_code),
+            )
@@ -0,0 +1,53 @@
+import asyncio
+import os
+
+import pytest
+
+for name, value in {
+    "MODE": "TEST",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_USER": "postgres",
+    "DB_PASS": "postgres",
+    "DB_NAME": "postgres",
+    "ECHO": "false",
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "15",
+    "REFRESH_TOKEN_EXPIRE_MINUTES": "60",
+}.items():
+    os.environ.setdefault(name, value)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def pg_connection():
+    """Run a test body against Postgres inside a transaction that is rolled back.
+
+    Set TEST_DATABASE_URL (postgresql+asyncpg://...) to enable these tests.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from database.models import Base
+
+    def run(body):
+        async def main():
+            engine = create_async_engine(TEST_DATABASE_URL)
+            try:
+                async with engine.connect() as connection:
+                    transaction = await connection.begin()
+                    try:
+                        await connection.run_sync(Base.metadata.create_all)
+                        return await body(connection)
+                    finally:
+                        await transaction.rollback()
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
@@ -0,0 +1,99 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.user.handlers import change_admin_privilege_batch
+from api.user.schemas import AdminPrivilegeBatch
+from authentication.principal import Principal
+from database.models import User
+from database.models.user import Role
+
+USER = Role.USER.value
+ADMIN = Role.ADMIN.value
+SUPERADMIN = Role.SUPERADMIN.value
+
+# The caller only needs the superadmin role and an id outside the batch.
+MANAGER = Principal(
+    id=2**31 - 1, email="manager@example.com", role=[SUPERADMIN], is_active=True
+)
+
+
+async def _users(session: AsyncSession, **roles: tuple[list[str], bool]) -> dict:
+    users = {
+        name: User(
+            username=name,
+            email=f"{name}@privilege.example.com",
+            role=role,
+            hashed_password="x",
+            is_active=is_active,
+        )
+        for name, (role, is_active) in roles.items()
+    }
+    session.add_all(users.values())
+    await session.flush()
+    return {name: user.id for name, user in users.items()}
+
+
+async def _roles(session: AsyncSession, ids: dict) -> dict:
+    rows = await session.execute(
+        select(User.id, User.role).where(User.id.in_(ids.values()))
+    )
+    roles = dict(rows.all())
+    return {name: roles[user_id] for name, user_id in ids.items()}
+
+
+async def _change(session: AsyncSession, ids: dict, names: list[str], action: str):
+    batch = AdminPrivilegeBatch(user_ids=[ids[name] for name in names], action=action)
+    result = await change_admin_privilege_batch(
+        batch, current_user=MANAGER, session=session
+    )
+    by_id = {user_id: name for name, user_id in ids.items()}
+    return (
+        sorted(by_id[user_id] for user_id in result.changed),
+        sorted(by_id[user_id] for user_id in result.unchanged),
+    )
+
+
+def test_grant_only_changes_active_non_admins(pg_connection):
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            ids = await _users(
+                session,
+                plain=([USER], True),
+                admin=([USER, ADMIN], True),
+                superadmin=([USER, SUPERADMIN], True),
+                inactive=([USER], False),
+            )
+            split = await _change(session, ids, list(ids), "grant")
+            return split, await _roles(session, ids)
+
+    (changed, unchanged), roles = pg_connection(body)
+    assert changed == ["plain"]
+    assert unchanged == ["admin", "inactive", "superadmin"]
+    assert roles == {
+        "plain": [USER, ADMIN],
+        "admin": [USER, ADMIN],
+        "superadmin": [USER, SUPERADMIN],
+        "inactive": [USER],
+    }
+
+
+def test_revoke_only_changes_active_admins(pg_connection):
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            ids = await _users(
+                session,
+                admin=([USER, ADMIN], True),
+                plain=([USER], True),
+                inactive_admin=([USER, ADMIN], False),
+            )
+            split = await _change(session, ids, list(ids), "revoke")
+            return split, await _roles(session, ids)
+
+    (changed, unchanged), roles = pg_connection(body)
+    assert changed == ["admin"]
+    assert unchanged == ["inactive_admin", "plain"]
+    assert roles == {
+        "admin": [USER],
+        "plain": [USER],
+        "inactive_admin": [USER, ADMIN],
+    }
@@ -0,0 +1,12 @@
+from main import create_app
+from database.db_helper import db_helper
+
+
+def test_create_app_instruments_engines_once():
+    create_app()
+    create_app()
+
+    for engine in db_helper.engines.values():
+        dispatch = engine.sync_engine.dispatch
+        assert len(dispatch.before_cursor_execute) == 1
+        assert len(dispatch.after_cursor_execute) == 1
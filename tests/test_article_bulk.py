@@ -0,0 +1,48 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.article import handlers
+from authentication.auth import get_current_user
+from database.db_helper import db_helper
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def create_articles(session, articles_in, user_id):
+        return [
+            SimpleNamespace(id=number, created_at=datetime(2024, 1, 1))
+            for number, _ in enumerate(articles_in, start=1)
+        ]
+
+    async def no_session():
+        yield None
+
+    monkeypatch.setattr(handlers, "_create_articles", create_articles)
+    app = FastAPI()
+    app.include_router(handlers.router)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1)
+    app.dependency_overrides[db_helper.session_dependency] = no_session
+    return TestClient(app)
+
+
+def test_non_object_items_are_reported_per_item(client):
+    response = client.post(
+        "/article/bulk", json=[{"title": "a", "content": "b"}, "oops", 3]
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [created["index"] for created in body["created"]] == [0]
+    assert [error["index"] for error in body["errors"]] == [1, 2]
+    assert body["errors"][0]["errors"][0]["type"] == "model_type"
+
+
+def test_batch_without_valid_items_is_rejected(client):
+    response = client.post("/article/bulk", json=["oops", {"title": "x" * 101}])
+
+    assert response.status_code == 422
+    assert [error["index"] for error in response.json()["detail"]] == [0, 1]
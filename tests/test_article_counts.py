@@ -0,0 +1,72 @@
+import asyncio
+import json
+from datetime import date
+
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from api.article.counts import count_articles
+
+USERNAME = "x :admin"
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class _Connection:
+    dialect = PGDialect_asyncpg()
+
+    def __init__(self):
+        self.executed = []
+
+    async def exec_driver_sql(self, statement, parameters):
+        self.executed.append((statement, parameters))
+        return _Result(json.dumps([{"Plan": {"Plan Rows": 42}}]))
+
+
+class _Session:
+    def __init__(self):
+        self.connection_ = _Connection()
+
+    async def connection(self):
+        return self.connection_
+
+
+def test_planner_estimate_sends_filters_as_bind_parameters():
+    session = _Session()
+
+    total = asyncio.run(
+        count_articles(
+            session,
+            filter_username=USERNAME,
+            date_from=date(2024, 1, 1),
+            date_to=None,
+            mode="estimated",
+        )
+    )
+
+    assert total == 42
+    [(statement, parameters)] = session.connection_.executed
+    assert statement.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert USERNAME not in statement
+    assert parameters[0] == USERNAME
+
+
+def test_planner_estimate_with_colon_in_username(pg_connection):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            return await count_articles(
+                session,
+                filter_username=USERNAME,
+                date_from=date(2024, 1, 1),
+                date_to=None,
+                mode="estimated",
+            )
+
+    assert pg_connection(body) >= 0
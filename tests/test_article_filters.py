@@ -0,0 +1,48 @@
+import itertools
+from datetime import date
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from api.article.dependencies import username_filter
+from api.article.filter_query import query_articles
+from benchmark.query_compile import select_articles
+
+
+def test_empty_username_means_no_filter():
+    app = FastAPI()
+
+    @app.get("/")
+    async def read(filter_username: str | None = Depends(username_filter)):
+        return {"username": filter_username}
+
+    client = TestClient(app)
+    assert client.get("/?username=").json() == {"username": None}
+    assert client.get("/").json() == {"username": None}
+    assert client.get("/?username=alex").json() == {"username": "alex"}
+
+
+def _sql(query) -> str:
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_benchmark_baseline_matches_lambda_builder():
+    for username, author_id, date_from, order, after_id in itertools.product(
+        (None, "alex"), (None, 7), (None, date(2024, 1, 1)), ("asc", "desc"), (None, 50)
+    ):
+        arguments = dict(
+            filter_username=username,
+            author_id=author_id,
+            date_from=date_from,
+            date_to=None,
+            order=order,
+            page=2,
+            limit=20,
+            after_id=after_id,
+        )
+        assert _sql(select_articles(**arguments)) == _sql(query_articles(**arguments))
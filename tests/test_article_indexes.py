@@ -0,0 +1,90 @@
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from api.article.filter_query import query_article_ids
+from database.models import Article, User
+
+
+def _index_columns(table) -> dict[str, list[str]]:
+    return {
+        index.name: [column.name for column in index.columns] for index in table.indexes
+    }
+
+
+def test_article_indexes_are_declared():
+    indexes = _index_columns(Article.__table__)
+    assert indexes["ix_article_created_at"] == ["created_at"]
+    assert indexes["ix_article_user_id_created_at_id"] == [
+        "user_id",
+        "created_at",
+        "id",
+    ]
+    assert _index_columns(User.__table__)["ix_user_username"] == ["username"]
+
+
+def test_date_filter_is_sargable_half_open_range():
+    query = query_article_ids(
+        None, None, date_from=date(2024, 1, 1), date_to=date(2024, 1, 31)
+    )
+    compiled = query.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert "CAST" not in sql.upper()
+    assert "article.created_at >= %(" in sql
+    assert "article.created_at < %(" in sql
+    assert datetime(2024, 1, 1) in compiled.params.values()
+    assert datetime(2024, 2, 1) in compiled.params.values()
+
+
+async def _explain(connection, query) -> str:
+    compiled = query.compile(dialect=connection.dialect)
+    raw = await connection.get_raw_connection()
+    # Disabling sequential scans makes the planner report whether an index
+    # can serve the predicate at all, regardless of the table size.
+    await raw.driver_connection.execute("SET LOCAL enable_seqscan = off")
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    result = await connection.exec_driver_sql(f"EXPLAIN {compiled.string}", params)
+    return "\n".join(row[0] for row in result)
+
+
+async def _insert_articles(connection) -> int:
+    user_id = await connection.scalar(
+        text(
+            'INSERT INTO "user" (username, email, role, hashed_password, is_active) '
+            "VALUES ('explain_user', 'explain@example.com', '{user}', 'x', true) "
+            "RETURNING id"
+        )
+    )
+    await connection.execute(
+        text(
+            "INSERT INTO article (title, content, created_at, user_id) "
+            "SELECT 'title', 'content', "
+            "timestamp '2024-01-01' + n * interval '1 hour', :user_id "
+            "FROM generate_series(1, 2000) AS n"
+        ),
+        {"user_id": user_id},
+    )
+    await connection.execute(text("ANALYZE article"))
+    return user_id
+
+
+def test_date_filter_uses_created_at_index(pg_connection):
+    async def body(connection):
+        await _insert_articles(connection)
+        query = query_article_ids(None, None, date(2024, 1, 10), date(2024, 1, 12))
+        return await _explain(connection, query)
+
+    plan = pg_connection(body)
+    assert "ix_article_created_at" in plan or "ix_article_user_id_created_at" in plan
+
+
+def test_author_date_filter_uses_composite_index(pg_connection):
+    async def body(connection):
+        user_id = await _insert_articles(connection)
+        query = query_article_ids(None, user_id, date(2024, 1, 10), date(2024, 1, 12))
+        return await _explain(connection, query)
+
+    plan = pg_connection(body)
+    assert "ix_article_user_id_created_at_id" in plan
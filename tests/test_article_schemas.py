@@ -0,0 +1,18 @@
+import pytest
+from pydantic import ValidationError
+
+from api.article.schemas import ArticleCreate, ArticleUpdate
+from database.models.article import TITLE_MAX_LENGTH
+
+
+def test_article_create_rejects_titles_longer_than_the_column():
+    ArticleCreate(title="t" * TITLE_MAX_LENGTH, content="")
+    with pytest.raises(ValidationError) as error:
+        ArticleCreate(title="t" * (TITLE_MAX_LENGTH + 1), content="")
+    assert error.value.errors()[0]["type"] == "string_too_long"
+
+
+def test_article_update_rejects_titles_longer_than_the_column():
+    assert ArticleUpdate().title is None
+    with pytest.raises(ValidationError):
+        ArticleUpdate(title="t" * (TITLE_MAX_LENGTH + 1))
@@ -0,0 +1,172 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.article.crud import _create_article, _delete_article, _update_article
+from api.article.permissions import check_write_result, permission_clause
+from api.article.schemas import ArticleCreate, ArticleUpdate
+from database.models import Article, ArticleCounter, ArticleDailyStats, User
+from database.models.user import Role
+
+MISSING_ID = 2**31 - 1
+
+
+async def _users(session: AsyncSession) -> tuple[User, User, User]:
+    users = [
+        User(
+            username=name,
+            email=f"{name}@writes.example.com",
+            role=[Role.USER.value, *extra_roles],
+            hashed_password="x",
+            is_active=True,
+        )
+        for name, extra_roles in (
+            ("owner", ()),
+            ("stranger", ()),
+            ("admin", (Role.ADMIN.value,)),
+        )
+    ]
+    session.add_all(users)
+    await session.flush()
+    return tuple(users)
+
+
+async def _article(session: AsyncSession, owner: User) -> Article:
+    return await _create_article(
+        session, ArticleCreate(title="Title", content="Content"), user_id=owner.id
+    )
+
+
+async def _counts(session: AsyncSession, article: Article) -> tuple[int, int]:
+    total = await session.scalar(
+        select(ArticleCounter.count).where(ArticleCounter.user_id == article.user_id)
+    )
+    daily = await session.scalar(
+        select(ArticleDailyStats.count).where(
+            ArticleDailyStats.user_id == article.user_id,
+            ArticleDailyStats.day == article.created_at.date(),
+        )
+    )
+    return total, daily
+
+
+def _status(result, article_id: int) -> int:
+    try:
+        check_write_result(result, article_id)
+    except HTTPException as error:
+        return error.status_code
+    return 200
+
+
+def test_owner_update_bumps_version(pg_connection):
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            owner, _, _ = await _users(session)
+            article = await _article(session, owner)
+            result = await _update_article(
+                session,
+                article.id,
+                ArticleUpdate(title="Renamed"),
+                permission_clause(owner),
+            )
+            return result, article.id
+
+    result, article_id = pg_connection(body)
+    assert _status(result, article_id) == 200
+    assert result.found is True
+    assert (result.id, result.title, result.version) == (article_id, "Renamed", 2)
+
+
+def test_owner_delete_decrements_rollups(pg_connection):
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            owner, _, _ = await _users(session)
+            article = await _article(session, owner)
+            before = await _counts(session, article)
+            result = await _delete_article(
+                session, article.id, permission_clause(owner)
+            )
+            after = await _counts(session, article)
+            remaining = await session.scalar(
+                select(Article.id).where(Article.id == article.id)
+            )
+            return result, article.id, before, after, remaining
+
+    result, article_id, before, after, remaining = pg_connection(body)
+    assert _status(result, article_id) == 200
+    assert result.id == article_id
+    assert before == (1, 1)
+    assert after == (0, 0)
+    assert remaining is None
+
+
+def test_non_owner_is_forbidden(pg_connection):
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            owner, stranger, _ = await _users(session)
+            article = await _article(session, owner)
+            updated = await _update_article(
+                session,
+                article.id,
+                ArticleUpdate(title="Hijacked"),
+                permission_clause(stranger),
+            )
+            deleted = await _delete_article(
+                session, article.id, permission_clause(stranger)
+            )
+            row = await session.execute(
+                select(Article.title, Article.version).where(Article.id == article.id)
+            )
+            return updated, deleted, article.id, row.one()
+
+    updated, deleted, article_id, row = pg_connection(body)
+    for result in (updated, deleted):
+        assert result.found is True
+        assert result.id is None
+        assert _status(result, article_id) == 403
+    assert tuple(row) == ("Title", 1)
+
+
+def test_missing_article_is_not_found(pg_connection):
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            owner, _, _ = await _users(session)
+            updated = await _update_article(
+                session, MISSING_ID, ArticleUpdate(title="x"), permission_clause(owner)
+            )
+            deleted = await _delete_article(
+                session, MISSING_ID, permission_clause(owner)
+            )
+            return updated, deleted
+
+    for result in pg_connection(body):
+        assert result.found is False
+        assert result.id is None
+        assert _status(result, MISSING_ID) == 404
+
+
+@pytest.mark.parametrize("write", ["update", "delete"])
+def test_admin_can_write_any_article(pg_connection, write):
+    async def body(connection):
+        async with AsyncSession(bind=connection) as session:
+            owner, _, admin = await _users(session)
+            article = await _article(session, owner)
+            if write == "update":
+                result = await _update_article(
+                    session,
+                    article.id,
+                    ArticleUpdate(content="Edited"),
+                    permission_clause(admin),
+                )
+            else:
+                result = await _delete_article(
+                    session, article.id, permission_clause(admin)
+                )
+            return result, article.id
+
+    result, article_id = pg_connection(body)
+    assert _status(result, article_id) == 200
+    assert result.id == article_id
+    if write == "update":
+        assert (result.content, result.version) == ("Edited", 2)
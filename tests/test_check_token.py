@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from authentication.auth import check_token
+from authentication.security import create_access_token
+from authentication.user_cache import (
+    get_cached_user,
+    invalidate_cached_users_on_commit,
+    user_cache,
+)
+from database.models import User
+
+EMAIL = "member@example.com"
+
+
+class _Session:
+    """Serves the revocation refresh and the user lookup from memory."""
+
+    def __init__(self, user: User):
+        self.user = user
+        self.lookups = 0
+
+    async def execute(self, query):
+        return []
+
+    async def scalar(self, query):
+        self.lookups += 1
+        return self.user
+
+
+def _user(is_active: bool) -> User:
+    return User(
+        id=1, username="member", email=EMAIL, role=["user"], is_active=is_active
+    )
+
+
+def _token() -> str:
+    return create_access_token({"sub": EMAIL}).removeprefix("Bearer ")
+
+
+def test_deactivated_user_is_refused_after_commit():
+    user_cache.clear()
+    session = _Session(_user(is_active=True))
+    token = _token()
+
+    assert asyncio.run(check_token(session, token)).id == 1
+    assert get_cached_user(EMAIL) is not None
+
+    # _delete_user flips is_active and queues the eviction for commit.
+    session.user = _user(is_active=False)
+    with Session(create_engine("sqlite://")) as sync_session:
+        with sync_session.begin():
+            invalidate_cached_users_on_commit(sync_session, {1})
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(check_token(session, token))
+    assert error.value.status_code == 401
+    assert session.lookups == 2
+
+
+def test_cached_inactive_user_is_refused():
+    user_cache.clear()
+    session = _Session(_user(is_active=False))
+    token = _token()
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            asyncio.run(check_token(session, token))
+    assert session.lookups == 1
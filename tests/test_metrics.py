@@ -0,0 +1,29 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from monitoring.collectors import request_duration
+from monitoring.metrics import Metric
+from monitoring.middleware import MetricsMiddleware
+
+
+def test_metric_requires_samples():
+    with pytest.raises(TypeError):
+        Metric("abstract_metric", "Cannot be rendered")
+
+
+def test_unknown_methods_share_one_label():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+
+    client.request("FOO", "/missing")
+    client.request("BAR", "/missing")
+
+    methods = {
+        labels["method"]
+        for _, labels, _ in request_duration.samples()
+        if labels.get("route") == "unmatched"
+    }
+    assert "other" in methods
+    assert not methods & {"FOO", "BAR"}
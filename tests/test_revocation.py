@@ -0,0 +1,39 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from authentication.revocation import RevocationList
+
+
+class _Session:
+    def __init__(self, rows: list[tuple]):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        await asyncio.sleep(0.01)
+        return list(self.rows)
+
+
+def _revoked_row(jti: str) -> tuple:
+    now = datetime.utcnow()
+    return jti, now + timedelta(minutes=5), now
+
+
+def test_unloaded_list_fails_closed():
+    assert RevocationList(refresh_seconds=5).is_revoked("any")
+
+
+def test_concurrent_callers_wait_for_the_first_refresh():
+    revocation_list = RevocationList(refresh_seconds=5)
+    session = _Session([_revoked_row("revoked")])
+
+    async def check(jti: str) -> bool:
+        await revocation_list.refresh(session)
+        return revocation_list.is_revoked(jti)
+
+    async def main():
+        return await asyncio.gather(check("revoked"), check("revoked"), check("ok"))
+
+    assert asyncio.run(main()) == [True, True, False]
+    assert session.queries == 1
@@ -0,0 +1,44 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from authentication.user_cache import (
+    cache_user,
+    get_cached_user,
+    invalidate_cached_users_on_commit,
+    user_cache,
+)
+from database.models import User
+
+
+def _cached_user(user_id: int, email: str) -> User:
+    user = User(
+        id=user_id,
+        username=f"user{user_id}",
+        email=email,
+        role=["user"],
+        is_active=True,
+    )
+    cache_user(user)
+    return user
+
+
+def test_invalidation_waits_for_commit():
+    user_cache.clear()
+    _cached_user(1, "first@example.com")
+    with Session(create_engine("sqlite://")) as session:
+        with session.begin():
+            invalidate_cached_users_on_commit(session, {1})
+            assert get_cached_user("first@example.com") is not None
+        assert get_cached_user("first@example.com") is None
+
+
+def test_rollback_discards_pending_invalidation():
+    user_cache.clear()
+    _cached_user(2, "second@example.com")
+    with Session(create_engine("sqlite://")) as session:
+        session.begin()
+        invalidate_cached_users_on_commit(session, {2})
+        session.rollback()
+        with session.begin():
+            pass
+    assert get_cached_user("second@example.com") is not None